@@ -3,6 +3,8 @@
 # Load necessary Python libraries
 from MineSweeperBoard import MineSweeperBoard
 from MineSweeperPlayer import MineSweeperPlayer
+from MineSweeperRenderer import createRenderer, CONST_RENDER_SILENT, CONST_RENDER_FINAL, CONST_RENDER_BUFFERED, CONST_RENDER_INCREMENTAL
+from MineSweeperSolver import CONST_SOLVER_BACKEND_CONSTRAINT, CONST_SOLVER_BACKEND_BITMASK, CONST_SOLVER_BACKEND_PROPAGATING
 
 CONST_GAMEBOARD_ROWS_BEGINNER = 9
 CONST_GAMEBOARD_COLS_BEGINNER = 9
@@ -16,6 +18,20 @@ CONST_GAMEBOARD_ROWS_EXPERT = 16
 CONST_GAMEBOARD_COLS_EXPERT = 30
 CONST_GAMEBOARD_MINES_EXPERT = 99
 
+# Seed used to place the mines; None picks a new board every run
+CONST_GAMEBOARD_SEED = None
+
+# Amount of output produced while the game is played: SILENT, FINAL
+# (final board only), BUFFERED (full trace written at the end of the
+# game) or INCREMENTAL (full trace written as the game is played)
+CONST_RENDER_LEVEL = CONST_RENDER_INCREMENTAL
+
+# Solver used by the player to count the solutions of its constraints:
+# CONSTRAINT (the python-constraint library), BITMASK (a search
+# specialized for Minesweeper constraints) or PROPAGATING (the
+# python-constraint library with its propagating, clause learning solver)
+CONST_SOLVER_BACKEND = CONST_SOLVER_BACKEND_BITMASK
+
 # Main application logic
 if __name__ == "__main__":
     # Predefined dimensions for the gameboard (these values can be changed)
@@ -23,27 +39,34 @@ if __name__ == "__main__":
     CONST_GAMEBOARD_COLS = CONST_GAMEBOARD_COLS_BEGINNER
     CONST_GAMEBOARD_MINES = CONST_GAMEBOARD_MINES_BEGINNER
     # Create a new instance of the Minesweeper game board
-    NewAIPlayer = MineSweeperPlayer(CONST_GAMEBOARD_ROWS, CONST_GAMEBOARD_COLS, CONST_GAMEBOARD_MINES)
-    NewGameboard = MineSweeperBoard(CONST_GAMEBOARD_ROWS, CONST_GAMEBOARD_COLS, CONST_GAMEBOARD_MINES)
-    NewGameboard.print()
+    NewRenderer = createRenderer(CONST_RENDER_LEVEL)
+    NewAIPlayer = MineSweeperPlayer(CONST_GAMEBOARD_ROWS, CONST_GAMEBOARD_COLS, CONST_GAMEBOARD_MINES, NewRenderer, solverBackend=CONST_SOLVER_BACKEND)
+    NewGameboard = MineSweeperBoard(CONST_GAMEBOARD_ROWS, CONST_GAMEBOARD_COLS, CONST_GAMEBOARD_MINES, CONST_GAMEBOARD_SEED, NewRenderer)
+    NewRenderer.renderBoard(NewGameboard)
     # NewGameboard.printDebug()
+    # The player reads the full board once; afterwards it is kept
+    # in sync with the tiles revealed by each move
+    NewAIPlayer.updatePlayerViewBoard(NewGameboard.getPlayerBoard())
     # While the game is not over, the player should keep
     # being prompted for their next move
     while not NewGameboard.isGameOver():
-      NewAIPlayer.updatePlayerViewBoard(NewGameboard.getPlayerBoard())
-      xCoordinate, yCoordinate = NewAIPlayer.makeMove()
-      print('player chose move: {},{}'.format(xCoordinate, yCoordinate))
+      # Every safe move the player has queued is played in one call
+      moves = NewAIPlayer.makeMoves()
+      for xCoordinate, yCoordinate in moves:
+        NewRenderer.renderMove(xCoordinate, yCoordinate)
       #xCoordinate = int(input('Please enter the x component of the tile: '))
       #yCoordinate = int(input('Please enter the y component of the tile: '))
       try:
-        NewGameboard.makeMove(xCoordinate, yCoordinate)
-        NewGameboard.print()
+        moveDelta = NewGameboard.makeMoves(moves)
+        NewAIPlayer.applyMoveDelta(moveDelta)
+        NewRenderer.renderBoard(NewGameboard)
         # NewGameboard.printDebug()
       except ValueError as error:
-        print(error)
-        print('invalid move selected, please select another tile')
+        NewRenderer.renderMessage(str(error))
+        NewRenderer.renderMessage('invalid move selected, please select another tile')
         continue
     # When the game has ended, then print a game over message
     # and exit the application
-    print('GAME OVER!')
+    NewRenderer.renderMessage('GAME OVER!')
+    NewRenderer.finishGame(NewGameboard)
     exit(0)
@@ -0,0 +1,111 @@
+# Import necessary Python libraries
+from fractions import Fraction
+
+def reduceRows(rows):
+  """Brings a system of linear equations to reduced row echelon form
+
+  Every row is a list of Fractions holding the coefficients of the
+  variables followed by the right hand side. The rows are reduced in
+  place with Gauss-Jordan elimination over the rationals, so the
+  result is exact. Rows that become all zeros are removed.
+
+  Parameters
+  ----------
+  rows : list
+    The augmented rows of the system
+
+  Returns
+  -------
+  list
+    The reduced rows (the same list object)
+  """
+  numberColumns = len(rows[0]) - 1 if rows else 0
+  pivotRow = 0
+  for column in range(numberColumns):
+    for row in range(pivotRow, len(rows)):
+      if rows[row][column] != 0:
+        break
+    else:
+      continue
+    rows[pivotRow], rows[row] = rows[row], rows[pivotRow]
+    pivot = rows[pivotRow]
+    if pivot[column] != 1:
+      scale = pivot[column]
+      pivot[:] = [value / scale for value in pivot]
+    for row in range(len(rows)):
+      factor = rows[row][column]
+      if row != pivotRow and factor != 0:
+        rows[row] = [value - factor * pivotValue for value, pivotValue in zip(rows[row], pivot)]
+    pivotRow += 1
+  del rows[pivotRow:]
+  return rows
+
+def getForcedValues(row):
+  """Finds the 0/1 variables whose value is forced by a single equation
+
+  With every variable limited to 0 or 1, the left hand side of the
+  equation lies between the sum of its negative and the sum of its
+  positive coefficients. A variable is forced to 0 when setting it to 1
+  would push the smallest reachable sum past the right hand side, and
+  forced to 1 when setting it to 0 would keep the largest reachable sum
+  below it.
+
+  Parameters
+  ----------
+  row : list
+    The coefficients of the variables followed by the right hand side
+
+  Returns
+  -------
+  list
+    The (column, value) pairs of the forced variables
+  """
+  *coefficients, total = row
+  lowest = sum(coefficient for coefficient in coefficients if coefficient < 0)
+  highest = sum(coefficient for coefficient in coefficients if coefficient > 0)
+  forcedValues = []
+  for column, coefficient in enumerate(coefficients):
+    if coefficient > 0:
+      if lowest + coefficient > total:
+        forcedValues.append((column, 0))
+      elif highest - coefficient < total:
+        forcedValues.append((column, 1))
+    elif coefficient < 0:
+      if highest + coefficient < total:
+        forcedValues.append((column, 0))
+      elif lowest - coefficient > total:
+        forcedValues.append((column, 1))
+  return forcedValues
+
+def solveLinearConstraints(constraints):
+  """Deduces the 0/1 variables forced by a set of sum constraints
+
+  The constraints are written as linear equations, reduced together,
+  and every reduced row is then checked for forced variables. This
+  runs in polynomial time and finds deductions that need several
+  equations to be combined.
+
+  Parameters
+  ----------
+  constraints : list
+    (tile, total, variables) constraint equations, as built by the player
+
+  Returns
+  -------
+  dict
+    The forced value (0 or 1) of each forced variable
+  """
+  variables = sorted(set(variable for constraint in constraints for variable in constraint[2]))
+  columns = dict((variable, column) for column, variable in enumerate(variables))
+  rows = []
+  for constraint in constraints:
+    row = [Fraction(0)] * (len(variables) + 1)
+    for variable in constraint[2]:
+      row[columns[variable]] = Fraction(1)
+    row[-1] = Fraction(constraint[1])
+    rows.append(row)
+  forcedValues = {}
+  for row in reduceRows(rows):
+    for column, value in getForcedValues(row):
+      forcedValues[variables[column]] = value
+  return forcedValues
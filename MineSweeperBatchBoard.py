@@ -0,0 +1,198 @@
+# Import necessary Python libraries
+import numpy as np
+from MineSweeperBoard import CONST_TILE_MINE, CONST_TILE_UNKNOWN, CONST_PLAYER_SYMBOLS, sampleMineIndices, countAdjacentMines, dilateTiles
+
+class MineSweeperBatchBoard:
+
+  def __init__(self, numberBoards, xDimension, yDimension, numberMines, seed=None):
+    """Initializes a batch of independent Minesweeper boards
+
+    All boards share the same dimensions and mine count, and are
+    stored as stacked arrays so that one call to makeMoves() plays a
+    move on every board at once.
+
+    Parameters
+    ----------
+    numberBoards : int
+      The number of boards in the batch
+    xDimension : int
+      The number of rows each gameboard possesses
+    yDimension : int
+      The number of columns each gameboard possesses
+    numberMines : int
+      The number of mines that each board contains. The
+      number should be positive, but less than the total
+      number tiles the board has
+    seed : int, optional
+      The seed used to place the mines. Board i is identical to
+      MineSweeperBoard(xDimension, yDimension, numberMines, batch.seeds[i])
+    """
+    self.numberBoards = numberBoards
+    self.xDimension = xDimension
+    self.yDimension = yDimension
+    self.numberMines = numberMines
+
+    # Sanity check to make sure that there are not more mines
+    # than actual tiles on the game board
+    if ((self.numberMines > (self.xDimension * self.yDimension)) or self.numberMines < 0):
+      raise ValueError('invalid number of mines entered')
+
+    # Every board gets its own independent random stream
+    self.seeds = np.random.SeedSequence(seed).spawn(self.numberBoards)
+
+    # The flat indices of the mines of each board are kept sorted, so a
+    # board that hits a mine can reveal the others without a full scan
+    self.mineIndices = np.zeros((self.numberBoards, self.numberMines), dtype=np.intp)
+    for board, boardSeed in enumerate(self.seeds):
+      self.mineIndices[board] = sampleMineIndices(np.random.default_rng(boardSeed), self.xDimension * self.yDimension, self.numberMines)
+    self.mineIndices.sort(axis=1)
+
+    # The game state and player view boards use the same tile codes as
+    # MineSweeperBoard, stacked along a leading board axis
+    mines = np.zeros((self.numberBoards, self.xDimension, self.yDimension), dtype=bool)
+    mines.reshape(self.numberBoards, -1)[np.arange(self.numberBoards)[:, np.newaxis], self.mineIndices] = True
+    self.gameStateBoards = np.where(mines, np.int8(CONST_TILE_MINE), countAdjacentMines(mines))
+    self.playerViewBoards = np.full(mines.shape, CONST_TILE_UNKNOWN, dtype=np.int8)
+
+    self.movesRemaining = np.full(self.numberBoards, (self.xDimension * self.yDimension) - self.numberMines)
+    self.gameOver = self.movesRemaining == 0
+    self.gameWon = self.movesRemaining == 0
+
+  def isGameOver(self):
+    """Returns a boolean array stating which games are over
+    """
+    return self.gameOver.copy()
+
+  def isGameWon(self):
+    """Returns a boolean array stating which games were won
+    """
+    return self.gameWon.copy()
+
+  def getPlayerBoard(self, board):
+    """Returns the 2D playerViewBoard of a single board in the batch
+
+    The board is returned as a list of lists using the same symbols
+    as MineSweeperBoard.getPlayerBoard().
+
+    Parameters
+    ----------
+    board : int
+      The index of the board in the batch
+    """
+    return CONST_PLAYER_SYMBOLS[self.playerViewBoards[board] - CONST_TILE_MINE].tolist()
+
+  def __uncoverZeroRegions(self, boards, starts):
+    """Computes the tiles uncovered by opening zero tiles on several boards
+
+    The regions are grown simultaneously on every board by repeatedly
+    dilating them through zero tiles. A board is dropped from the
+    stack being dilated as soon as its region stops growing, so the
+    work shrinks with the number of regions still spreading.
+
+    Parameters
+    ----------
+    boards : numpy.ndarray
+      The indices of the boards whose zero tiles were opened
+    starts : numpy.ndarray
+      Boolean array marking the opened zero tile of each board
+
+    Returns
+    -------
+    numpy.ndarray
+      Boolean array marking every tile uncovered on each board
+    """
+    zeroTiles = self.gameStateBoards[boards] == 0
+    regions = starts
+    # Positions in regions of the boards whose region is still growing,
+    # and the stack of those regions
+    growing = np.arange(len(boards))
+    region = starts
+    while len(growing):
+      grown = dilateTiles(region) & zeroTiles
+      changed = (grown != region).any(axis=(1, 2))
+      if changed.all():
+        region = grown
+        continue
+      # Store the regions that stopped growing and keep dilating the others
+      regions[growing[~changed]] = grown[~changed]
+      growing = growing[changed]
+      region = grown[changed]
+      zeroTiles = zeroTiles[changed]
+    return dilateTiles(regions)
+
+  def makeMoves(self, xCoordinates, yCoordinates):
+    """Plays one move on every board in the batch
+
+    Boards whose game is already over ignore their move, as do moves
+    on tiles that have already been played.
+
+    Parameters
+    ----------
+    xCoordinates : array
+      x coordinate of the tile selected on each board
+    yCoordinates : array
+      y coordinate of the tile selected on each board
+
+    Returns
+    -------
+    list
+      The move delta of each board: a list of the (x, y, value) tuples
+      revealed by its move, in the format of MineSweeperBoard.makeMove()
+    numpy.ndarray
+      Boolean array stating which games are over after the moves
+    """
+    xCoordinates = np.asarray(xCoordinates)
+    yCoordinates = np.asarray(yCoordinates)
+    # Sanitize the user input coordinates of the games still in play
+    boards = np.flatnonzero(~self.gameOver)
+    xCoordinates = xCoordinates[boards]
+    yCoordinates = yCoordinates[boards]
+    if ((xCoordinates < 0) | (xCoordinates >= self.xDimension) | (yCoordinates < 0) | (yCoordinates >= self.yDimension)).any():
+      raise ValueError('invalid coordinate pair chosen')
+    # Moves on tiles that have already been played are ignored
+    unplayed = self.playerViewBoards[boards, xCoordinates, yCoordinates] == CONST_TILE_UNKNOWN
+    boards = boards[unplayed]
+    xCoordinates = xCoordinates[unplayed]
+    yCoordinates = yCoordinates[unplayed]
+
+    # Reveal the selected tiles; tiles holding a number need nothing else
+    tileValues = self.gameStateBoards[boards, xCoordinates, yCoordinates]
+    self.playerViewBoards[boards, xCoordinates, yCoordinates] = tileValues
+    hitMine = tileValues == CONST_TILE_MINE
+    self.movesRemaining[boards[~hitMine]] -= 1
+    moveDeltas = [[] for board in range(self.numberBoards)]
+    symbols = CONST_PLAYER_SYMBOLS[tileValues - CONST_TILE_MINE]
+    for board, x, y, symbol in zip(boards.tolist(), xCoordinates.tolist(), yCoordinates.tolist(), symbols.tolist()):
+      moveDeltas[board].append((x, y, symbol))
+
+    # Players that hit a mine see every other mine on their board, and
+    # zero tiles uncover their whole region. The uncovered tiles are
+    # gathered as (board, flat index) pairs so that only those tiles of
+    # the stacked boards are read and written
+    openedZero = tileValues == 0
+    revealedBoards = [boards[hitMine].repeat(self.numberMines)]
+    revealedIndices = [self.mineIndices[boards[hitMine]].reshape(-1)]
+    if openedZero.any():
+      starts = np.zeros((int(openedZero.sum()), self.xDimension, self.yDimension), dtype=bool)
+      starts[np.arange(len(starts)), xCoordinates[openedZero], yCoordinates[openedZero]] = True
+      regionPositions, regionIndices = np.nonzero(self.__uncoverZeroRegions(boards[openedZero], starts).reshape(len(starts), -1))
+      revealedBoards.append(boards[openedZero][regionPositions])
+      revealedIndices.append(regionIndices)
+    revealedBoards = np.concatenate(revealedBoards)
+    if len(revealedBoards):
+      revealedIndices = np.concatenate(revealedIndices)
+      playerViews = self.playerViewBoards.reshape(self.numberBoards, -1)
+      hidden = playerViews[revealedBoards, revealedIndices] == CONST_TILE_UNKNOWN
+      revealedBoards = revealedBoards[hidden]
+      revealedIndices = revealedIndices[hidden]
+      revealedValues = self.gameStateBoards.reshape(self.numberBoards, -1)[revealedBoards, revealedIndices]
+      playerViews[revealedBoards, revealedIndices] = revealedValues
+      self.movesRemaining -= np.bincount(revealedBoards[revealedValues != CONST_TILE_MINE], minlength=self.numberBoards)
+      xRevealed, yRevealed = np.divmod(revealedIndices, self.yDimension)
+      symbols = CONST_PLAYER_SYMBOLS[revealedValues - CONST_TILE_MINE]
+      for board, x, y, symbol in zip(revealedBoards.tolist(), xRevealed.tolist(), yRevealed.tolist(), symbols.tolist()):
+        moveDeltas[board].append((x, y, symbol))
+
+    self.gameWon[boards] = self.movesRemaining[boards] == 0
+    self.gameOver[boards] = hitMine | self.gameWon[boards]
+    return moveDeltas, self.gameOver.copy()
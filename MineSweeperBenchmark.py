@@ -0,0 +1,367 @@
+#!/bin/python3
+
+# Load necessary Python libraries
+import random
+import sys
+import time
+import numpy as np
+from MineSweeperBoard import MineSweeperBoard, CONST_TILE_UNKNOWN
+from MineSweeperBatchBoard import MineSweeperBatchBoard
+from MineSweeperCompactBoard import MineSweeperCompactBoard
+from MineSweeperGenerator import generateNoGuessBoard
+from MineSweeperPlayer import MineSweeperPlayer
+from MineSweeperRenderer import MineSweeperRenderer
+from MineSweeperSolver import CONST_SOLVER_BACKEND_CONSTRAINT, CONST_SOLVER_BACKEND_BITMASK, CONST_SOLVER_BACKEND_PROPAGATING, CONST_SOLVER_CACHE_SIZE
+
+CONST_BENCHMARK_FLOOD_SIZES = [10, 25, 50, 100, 250, 500, 1000]
+CONST_BENCHMARK_FLOOD_DENSITY = 0.02
+
+CONST_BENCHMARK_DIFFICULTIES = [
+  ('beginner', 9, 9, 10),
+  ('intermediate', 16, 16, 40),
+  ('expert', 16, 30, 99),
+  ('dense 1000x1000', 1000, 1000, 500000),
+]
+CONST_BENCHMARK_GENERATION_SECONDS = 1.0
+CONST_BENCHMARK_BATCH_BOARDS = 1000
+CONST_BENCHMARK_PLAYER_BOARDS = 20
+CONST_BENCHMARK_MEMORY_SIZES = [100, 1000, 3000]
+CONST_BENCHMARK_NO_GUESS_SECONDS = 5.0
+CONST_BENCHMARK_SOLVER_BACKENDS = [
+  ('constraint', CONST_SOLVER_BACKEND_CONSTRAINT),
+  ('bitmask', CONST_SOLVER_BACKEND_BITMASK),
+  ('propagating', CONST_SOLVER_BACKEND_PROPAGATING),
+]
+CONST_BENCHMARK_CACHE_SIZES = [None, CONST_SOLVER_CACHE_SIZE]
+
+def recursiveUncover(board, x, y):
+  """Reference recursive flood fill used by the original MineSweeperBoard
+
+  This function reproduces the recursive __uncoverAdjTiles() that the
+  board used before the scanline fill, so the two can be compared. It
+  reveals the region around (x, y) on the given board and raises a
+  RecursionError when the region is too large for the interpreter.
+
+  Parameters
+  ----------
+  board : MineSweeperBoard
+    The board whose playerViewBoard should be uncovered
+  x : int
+    x coordinate of the zero tile at the center of the region
+  y : int
+    y coordinate of the zero tile at the center of the region
+  """
+  if board.gameStateBoard[x, y] != 0:
+    return
+  for nx in range(x - 1, x + 2):
+    for ny in range(y - 1, y + 2):
+      if nx < 0 or nx >= board.xDimension or ny < 0 or ny >= board.yDimension:
+        continue
+      if board.playerViewBoard[nx, ny] != CONST_TILE_UNKNOWN:
+        continue
+      board.playerViewBoard[nx, ny] = board.gameStateBoard[nx, ny]
+      board.movesRemaining -= 1
+      recursiveUncover(board, nx, ny)
+
+def benchmarkFloodFill(sizes=CONST_BENCHMARK_FLOOD_SIZES, mineDensity=CONST_BENCHMARK_FLOOD_DENSITY, seed=0):
+  """Compares the scanline flood fill against the recursive version
+
+  For every board size, two identical square boards are generated and
+  the same zero tile is opened on both: once through makeMove() and
+  once through recursiveUncover(). The time taken and the number of
+  tiles revealed are printed for each implementation.
+
+  Parameters
+  ----------
+  sizes : list, optional
+    The side lengths of the square boards to benchmark
+  mineDensity : float, optional
+    The fraction of tiles that contain a mine
+  seed : int, optional
+    The random seed used to generate the boards
+  """
+  print('{:>6} {:>10} {:>12} {:>12}'.format('size', 'revealed', 'scanline(s)', 'recursive(s)'))
+  for size in sizes:
+    numberMines = int(size * size * mineDensity)
+    board = MineSweeperBoard(size, size, numberMines, seed, MineSweeperRenderer())
+    referenceBoard = MineSweeperBoard(size, size, numberMines, seed, MineSweeperRenderer())
+    zeroTiles = np.argwhere(board.gameStateBoard == 0)
+    if len(zeroTiles) == 0:
+      continue
+    x, y = (int(value) for value in zeroTiles[0])
+
+    movesRemaining = board.movesRemaining
+    startTime = time.perf_counter()
+    board.makeMove(x, y)
+    scanlineTime = time.perf_counter() - startTime
+
+    startTime = time.perf_counter()
+    try:
+      referenceBoard.playerViewBoard[x, y] = 0
+      referenceBoard.movesRemaining -= 1
+      recursiveUncover(referenceBoard, x, y)
+      recursiveTime = '{:.4f}'.format(time.perf_counter() - startTime)
+    except RecursionError:
+      recursiveTime = 'overflow'
+    print('{:>6} {:>10} {:>12.4f} {:>12}'.format(size, movesRemaining - board.movesRemaining, scanlineTime, recursiveTime))
+
+def benchmarkBoardGeneration(difficulties=CONST_BENCHMARK_DIFFICULTIES, duration=CONST_BENCHMARK_GENERATION_SECONDS):
+  """Measures how many seeded boards can be generated per second
+
+  Boards are generated with consecutive integer seeds, so every
+  board in the run can be reproduced later from its seed alone.
+
+  Parameters
+  ----------
+  difficulties : list, optional
+    (name, rows, columns, mines) tuples describing the boards to generate
+  duration : float, optional
+    The number of seconds to spend generating boards of each difficulty
+  """
+  print('{:>16} {:>10} {:>12}'.format('difficulty', 'boards', 'boards/s'))
+  for name, xDimension, yDimension, numberMines in difficulties:
+    numberBoards = 0
+    startTime = time.perf_counter()
+    while time.perf_counter() - startTime < duration:
+      MineSweeperBoard(xDimension, yDimension, numberMines, numberBoards, MineSweeperRenderer())
+      numberBoards += 1
+    elapsedTime = time.perf_counter() - startTime
+    print('{:>16} {:>10} {:>12.1f}'.format(name, numberBoards, numberBoards / elapsedTime))
+
+def benchmarkNoGuessGeneration(difficulties=CONST_BENCHMARK_DIFFICULTIES[:3], duration=CONST_BENCHMARK_NO_GUESS_SECONDS):
+  """Measures how many no-guess boards can be generated per second
+
+  Every board is generated with generateNoGuessBoard(), using
+  consecutive integer seeds. At least one board is generated for
+  each difficulty, however long it takes.
+
+  Parameters
+  ----------
+  difficulties : list, optional
+    (name, rows, columns, mines) tuples describing the boards to generate
+  duration : float, optional
+    The number of seconds to spend generating boards of each difficulty
+  """
+  print('{:>16} {:>10} {:>12}'.format('difficulty', 'boards', 'boards/s'))
+  for name, xDimension, yDimension, numberMines in difficulties:
+    numberBoards = 0
+    startTime = time.perf_counter()
+    while numberBoards == 0 or time.perf_counter() - startTime < duration:
+      generateNoGuessBoard(xDimension, yDimension, numberMines, numberBoards)
+      numberBoards += 1
+    elapsedTime = time.perf_counter() - startTime
+    print('{:>16} {:>10} {:>12.3f}'.format(name, numberBoards, numberBoards / elapsedTime))
+
+def chooseRandomMoves(rng, playerViewBoards):
+  """Chooses a random unplayed tile on each board of a stack
+
+  Parameters
+  ----------
+  rng : numpy.random.Generator
+    The random number generator to draw from
+  playerViewBoards : numpy.ndarray
+    The stacked player view boards of a MineSweeperBatchBoard
+
+  Returns
+  -------
+  tuple
+    Arrays with the x and y coordinates of the chosen tiles
+  """
+  numberBoards, xDimension, yDimension = playerViewBoards.shape
+  scores = rng.random((numberBoards, xDimension * yDimension))
+  scores[playerViewBoards.reshape(numberBoards, -1) != CONST_TILE_UNKNOWN] = -1
+  return np.divmod(scores.argmax(axis=1), yDimension)
+
+def benchmarkBatchThroughput(difficulties=CONST_BENCHMARK_DIFFICULTIES[:3], numberBoards=CONST_BENCHMARK_BATCH_BOARDS, seed=0):
+  """Measures games per second of the batch engine against single boards
+
+  Every game is played to the end by an agent that clicks random
+  unplayed tiles: once with all boards held in a MineSweeperBatchBoard,
+  and once one MineSweeperBoard at a time.
+
+  Parameters
+  ----------
+  difficulties : list, optional
+    (name, rows, columns, mines) tuples describing the boards to play
+  numberBoards : int, optional
+    The number of games to play for each difficulty
+  seed : int, optional
+    The random seed used to generate the boards and moves
+  """
+  print('{:>16} {:>10} {:>12} {:>12}'.format('difficulty', 'games', 'batch/s', 'single/s'))
+  for name, xDimension, yDimension, numberMines in difficulties:
+    rng = np.random.default_rng(seed)
+    startTime = time.perf_counter()
+    batch = MineSweeperBatchBoard(numberBoards, xDimension, yDimension, numberMines, seed)
+    xCoordinates = np.zeros(numberBoards, dtype=int)
+    yCoordinates = np.zeros(numberBoards, dtype=int)
+    while not batch.gameOver.all():
+      # Moves are only drawn for the games still in play
+      boards = np.flatnonzero(~batch.gameOver)
+      xCoordinates[boards], yCoordinates[boards] = chooseRandomMoves(rng, batch.playerViewBoards[boards])
+      batch.makeMoves(xCoordinates, yCoordinates)
+    batchTime = time.perf_counter() - startTime
+
+    rng = np.random.default_rng(seed)
+    startTime = time.perf_counter()
+    for boardSeed in batch.seeds:
+      board = MineSweeperBoard(xDimension, yDimension, numberMines, boardSeed, MineSweeperRenderer())
+      while not board.isGameOver():
+        x, y = chooseRandomMoves(rng, board.playerViewBoard[np.newaxis])
+        board.makeMove(int(x[0]), int(y[0]))
+    singleTime = time.perf_counter() - startTime
+    print('{:>16} {:>10} {:>12.1f} {:>12.1f}'.format(name, numberBoards, numberBoards / batchTime, numberBoards / singleTime))
+
+def benchmarkPlayerThroughput(difficulties=CONST_BENCHMARK_DIFFICULTIES[:2], numberBoards=CONST_BENCHMARK_PLAYER_BOARDS, seed=0):
+  """Measures how many games per second the AI player completes
+
+  One MineSweeperPlayer is created for every board of a
+  MineSweeperBatchBoard, and each turn the moves of all players whose
+  game is still in play are applied in a single batched call.
+
+  Parameters
+  ----------
+  difficulties : list, optional
+    (name, rows, columns, mines) tuples describing the boards to play
+  numberBoards : int, optional
+    The number of games to play for each difficulty
+  seed : int, optional
+    The random seed used to generate the boards
+  """
+  print('{:>16} {:>10} {:>10} {:>12}'.format('difficulty', 'games', 'won', 'games/s'))
+  for name, xDimension, yDimension, numberMines in difficulties:
+    startTime = time.perf_counter()
+    batch = MineSweeperBatchBoard(numberBoards, xDimension, yDimension, numberMines, seed)
+    players = [MineSweeperPlayer(xDimension, yDimension, numberMines, MineSweeperRenderer()) for board in range(numberBoards)]
+    xCoordinates = np.zeros(numberBoards, dtype=int)
+    yCoordinates = np.zeros(numberBoards, dtype=int)
+    for board, player in enumerate(players):
+      player.updatePlayerViewBoard(batch.getPlayerBoard(board))
+    while not batch.gameOver.all():
+      for board in np.flatnonzero(~batch.gameOver).tolist():
+        xCoordinates[board], yCoordinates[board] = players[board].makeMove()
+      moveDeltas, _ = batch.makeMoves(xCoordinates, yCoordinates)
+      for player, moveDelta in zip(players, moveDeltas):
+        player.applyMoveDelta(moveDelta)
+    elapsedTime = time.perf_counter() - startTime
+    print('{:>16} {:>10} {:>10} {:>12.2f}'.format(name, numberBoards, int(batch.gameWon.sum()), numberBoards / elapsedTime))
+
+def benchmarkSolverBackends(difficulties=CONST_BENCHMARK_DIFFICULTIES[:3], backends=CONST_BENCHMARK_SOLVER_BACKENDS, numberBoards=CONST_BENCHMARK_PLAYER_BOARDS, seed=0):
+  """Compares how fast the AI player completes games with each solver backend
+
+  Every backend plays the same boards with the same random guesses, so
+  the games only differ in the order the forced tiles are played. The
+  number of search nodes the backend visited per game is reported as
+  well; a node is a value tried by the constraint.BacktrackingSolver, a
+  decision of the constraint.PropagatingSolver, and a call of the
+  bitmask search. The solution cache is turned off so that every
+  backend runs every search.
+
+  Parameters
+  ----------
+  difficulties : list, optional
+    (name, rows, columns, mines) tuples describing the boards to play
+  backends : list, optional
+    (name, backend) pairs of the CONST_SOLVER_BACKEND_* backends to compare
+  numberBoards : int, optional
+    The number of games to play for each difficulty and backend
+  seed : int, optional
+    The random seed used to generate the boards and the guesses
+  """
+  print('{:>16} {:>12} {:>10} {:>10} {:>12} {:>12}'.format('difficulty', 'backend', 'games', 'won', 'games/s', 'nodes/game'))
+  for name, xDimension, yDimension, numberMines in difficulties:
+    for backendName, backend in backends:
+      random.seed(seed)
+      numberWon = 0
+      numberNodes = 0
+      startTime = time.perf_counter()
+      for board in range(numberBoards):
+        renderer = MineSweeperRenderer()
+        gameboard = MineSweeperBoard(xDimension, yDimension, numberMines, seed + board, renderer)
+        player = MineSweeperPlayer(xDimension, yDimension, numberMines, renderer, solverBackend=backend, solverCacheSize=None)
+        player.updatePlayerViewBoard(gameboard.getPlayerBoard())
+        while not gameboard.isGameOver():
+          player.applyMoveDelta(gameboard.makeMove(*player.makeMove()))
+        numberWon += gameboard.movesRemaining == 0
+        numberNodes += player.solver.nodes
+      elapsedTime = time.perf_counter() - startTime
+      print('{:>16} {:>12} {:>10} {:>10} {:>12.2f} {:>12.1f}'.format(name, backendName, numberBoards, numberWon, numberBoards / elapsedTime, numberNodes / numberBoards))
+
+def benchmarkSolutionCache(difficulties=CONST_BENCHMARK_DIFFICULTIES[:3], cacheSizes=CONST_BENCHMARK_CACHE_SIZES, numberBoards=CONST_BENCHMARK_PLAYER_BOARDS, seed=0):
+  """Measures how much the cross-move solution cache speeds up the AI player
+
+  Every cache size plays the same boards with the same random guesses
+  using the default solver backend. The hit rate is the fraction of
+  the constraint sets that were found in the cache.
+
+  Parameters
+  ----------
+  difficulties : list, optional
+    (name, rows, columns, mines) tuples describing the boards to play
+  cacheSizes : list, optional
+    The solverCacheSize values to compare; None plays without a cache
+  numberBoards : int, optional
+    The number of games to play for each difficulty and cache size
+  seed : int, optional
+    The random seed used to generate the boards and the guesses
+  """
+  print('{:>16} {:>10} {:>10} {:>10} {:>12} {:>10}'.format('difficulty', 'cache', 'games', 'won', 'games/s', 'hit rate'))
+  for name, xDimension, yDimension, numberMines in difficulties:
+    for cacheSize in cacheSizes:
+      random.seed(seed)
+      numberWon = 0
+      numberHits = 0
+      numberLookups = 0
+      startTime = time.perf_counter()
+      for board in range(numberBoards):
+        renderer = MineSweeperRenderer()
+        gameboard = MineSweeperBoard(xDimension, yDimension, numberMines, seed + board, renderer)
+        player = MineSweeperPlayer(xDimension, yDimension, numberMines, renderer, solverCacheSize=cacheSize)
+        player.updatePlayerViewBoard(gameboard.getPlayerBoard())
+        while not gameboard.isGameOver():
+          player.applyMoveDelta(gameboard.makeMove(*player.makeMove()))
+        numberWon += gameboard.movesRemaining == 0
+        if cacheSize:
+          numberHits += player.solver.hits
+          numberLookups += player.solver.hits + player.solver.misses
+      elapsedTime = time.perf_counter() - startTime
+      hitRate = numberHits / numberLookups if numberLookups else 0.0
+      print('{:>16} {:>10} {:>10} {:>10} {:>12.2f} {:>10.2%}'.format(name, str(cacheSize), numberBoards, numberWon, numberBoards / elapsedTime, hitRate))
+
+def benchmarkMemoryPerTile(sizes=CONST_BENCHMARK_MEMORY_SIZES, mineDensity=CONST_BENCHMARK_FLOOD_DENSITY, seed=0):
+  """Compares the memory used per tile by each board representation
+
+  The list representation is what the original MineSweeperBoard kept:
+  one list of Python objects per row for both the game state and the
+  player view. Only the containers are counted, since the small ints
+  and strings they point to are shared by the interpreter.
+
+  Parameters
+  ----------
+  sizes : list, optional
+    The side lengths of the square boards to measure
+  mineDensity : float, optional
+    The fraction of tiles that contain a mine
+  seed : int, optional
+    The random seed used to generate the boards
+  """
+  print('{:>6} {:>12} {:>12} {:>12}'.format('size', 'lists(B)', 'numpy(B)', 'compact(B)'))
+  for size in sizes:
+    numberTiles = size * size
+    numberMines = int(numberTiles * mineDensity)
+    board = MineSweeperBoard(size, size, numberMines, seed, MineSweeperRenderer())
+    listBytes = sum(sys.getsizeof(row) for row in board.gameStateBoard.tolist()) + sum(sys.getsizeof(row) for row in board.getPlayerBoard())
+    numpyBytes = board.gameStateBoard.nbytes + board.playerViewBoard.nbytes
+    compactBytes = MineSweeperCompactBoard(size, size, numberMines, seed, MineSweeperRenderer()).memoryUsage()
+    print('{:>6} {:>12.3f} {:>12.3f} {:>12.3f}'.format(size, listBytes / numberTiles, numpyBytes / numberTiles, compactBytes / numberTiles))
+
+# Main application logic
+if __name__ == "__main__":
+    benchmarkFloodFill()
+    benchmarkBoardGeneration()
+    benchmarkNoGuessGeneration()
+    benchmarkBatchThroughput()
+    benchmarkPlayerThroughput()
+    benchmarkSolverBackends()
+    benchmarkSolutionCache()
+    benchmarkMemoryPerTile()
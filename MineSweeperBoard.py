@@ -1,9 +1,103 @@
 # Import necessary Python libraries
-import random
+import numpy as np
+from MineSweeperRenderer import IncrementalRenderer
+
+# Tile codes shared by the gameStateBoard and playerViewBoard arrays
+CONST_TILE_MINE = -9
+CONST_TILE_UNKNOWN = -1
+
+# Lookup table translating playerViewBoard codes into the symbols of the
+# legacy list view (indexed by code - CONST_TILE_MINE)
+CONST_PLAYER_SYMBOLS = np.array(['x'] + [None] * 7 + ['@', '-'] + list(range(1, 9)), dtype=object)
+
+def sampleMineIndices(rng, numberTiles, numberMines):
+  """Samples distinct flat tile indices to hold mines
+
+  Mine locations are sampled without replacement using Robert
+  Floyd's algorithm, which draws exactly one random number per
+  mine. The running time is proportional to the number of mines
+  regardless of how densely they are packed.
+
+  Parameters
+  ----------
+  rng : numpy.random.Generator
+    The random number generator to draw from
+  numberTiles : int
+    The total number of tiles on the board
+  numberMines : int
+    The number of distinct tiles to sample
+
+  Returns
+  -------
+  list
+    The flat indices of the tiles holding mines
+  """
+  # For the j-th of the last numberMines tile indices, draw a tile
+  # uniformly from [0, j] and fall back to j itself on a collision.
+  # A dict is used as an insertion-ordered set of the sampled tiles
+  draws = rng.integers(0, np.arange(numberTiles - numberMines + 1, numberTiles + 1))
+  mineIndices = {}
+  for index, draw in enumerate(draws.tolist(), numberTiles - numberMines):
+    mineIndices[index if draw in mineIndices else draw] = None
+  return list(mineIndices)
+
+def countAdjacentMines(mines):
+  """Counts the mines adjacent to every tile of one or more boards
+
+  The neighbor counts are computed in a single vectorized pass by
+  summing the eight shifted views of a zero-padded mine mask. Any
+  leading dimensions are treated as a stack of independent boards.
+
+  Parameters
+  ----------
+  mines : numpy.ndarray
+    Boolean mask of the mine locations; the last two axes are the
+    rows and columns of each board
+
+  Returns
+  -------
+  numpy.ndarray
+    int8 array of the same shape holding the adjacent mine counts
+  """
+  xDimension, yDimension = mines.shape[-2:]
+  padding = [(0, 0)] * (mines.ndim - 2) + [(1, 1), (1, 1)]
+  padded = np.pad(mines.astype(np.int8), padding)
+  counts = np.zeros(mines.shape, dtype=np.int8)
+  for dx in range(3):
+    for dy in range(3):
+      if dx == 1 and dy == 1:
+        continue
+      counts += padded[..., dx:dx + xDimension, dy:dy + yDimension]
+  return counts
+
+def dilateTiles(tiles):
+  """Grows a stack of boolean tile masks by one tile in every direction
+
+  Parameters
+  ----------
+  tiles : numpy.ndarray
+    Boolean array whose last two axes are the rows and columns of
+    each board
+
+  Returns
+  -------
+  numpy.ndarray
+    Boolean array of the same shape that is True for every tile in,
+    or adjacent to, a True tile of the input
+  """
+  # The 3x3 neighborhood is separable: grow along the rows, then grow
+  # the result along the columns
+  dilated = tiles.copy()
+  dilated[..., 1:, :] |= tiles[..., :-1, :]
+  dilated[..., :-1, :] |= tiles[..., 1:, :]
+  rows = dilated.copy()
+  dilated[..., 1:] |= rows[..., :-1]
+  dilated[..., :-1] |= rows[..., 1:]
+  return dilated
 
 class MineSweeperBoard:
 
-  def __init__(self, xDimension, yDimension, numberMines):
+  def __init__(self, xDimension, yDimension, numberMines, seed=None, renderer=None, mineIndices=None):
     """Initialization function
 
     Parameters
@@ -16,10 +110,22 @@ class MineSweeperBoard:
       The number of mines that the board contains. The 
       number should be positive, but less than the total
       number tiles the board has
+    seed : int or numpy.random.Generator, optional
+      The seed (or random number generator) used to place the
+      mines. Boards created with the same seed are identical;
+      by default a fresh, unpredictable seed is used
+    renderer : MineSweeperRenderer, optional
+      The renderer that status messages are reported to (default is
+      an IncrementalRenderer writing to standard output)
+    mineIndices : list, optional
+      The flat indices (x * yDimension + y) of the tiles holding mines.
+      When given, the mines are placed there instead of randomly
     """
     self.xDimension = xDimension
     self.yDimension = yDimension
     self.numberMines = numberMines
+    self.rng = np.random.default_rng(seed)
+    self.renderer = renderer if renderer is not None else IncrementalRenderer()
 
     # Store the coordinates of mines when they are created so
     # an O(n^2) iteration is not necessary
@@ -29,27 +135,39 @@ class MineSweeperBoard:
     if self.movesRemaining == 0:
       self.gameOver = True
 
+    # Undo journal of the moves made and flags toggled since the first
+    # checkpoint, as (movesRemaining, gameOver, moveDelta, flagged tile)
+    # entries; None while no checkpoint has been taken so normal games
+    # record nothing
+    self.journal = None
+
     # Sanity check to make sure that there are not more mines
     # than actual tiles on the game board
     if ((self.numberMines > (self.xDimension * self.yDimension)) or self.numberMines < 0):
       raise ValueError('invalid number of mines entered')
+    if mineIndices is not None and (len(set(mineIndices)) != self.numberMines or any(not 0 <= index < self.xDimension * self.yDimension for index in mineIndices)):
+      raise ValueError('invalid mine locations entered')
 
-    # Game state board consists of the following numbers:
+    # Game state board is an int8 array consisting of the following numbers:
     # -  -1 = Empty tile (only used when the board is first initialized)
     # -  -9 = Mine location
-    # - 0-9 = Number of adjacent mines to a tile 
-    self.gameStateBoard = [[-1 for x in range(self.yDimension)] for y in range(self.xDimension)]
+    # - 0-8 = Number of adjacent mines to a tile 
+    self.gameStateBoard = np.full((self.xDimension, self.yDimension), CONST_TILE_UNKNOWN, dtype=np.int8)
     
-    # Player gameboard view consists of the following symbols
-    # -   @ = Unknown (not yet selected) tile
-    # -   x = Mine location
-    # -   - = 0 value (no adjacent mines)
-    # - 1-9 = Number of adjacent mines
-    self.playerViewBoard = [['@' for x in range(self.yDimension)] for y in range(self.xDimension)]
+    # Player gameboard view is an int8 array using the same codes, which
+    # getPlayerBoard() translates into the following symbols
+    # -  -1 = @ = Unknown (not yet selected) tile
+    # -  -9 = x = Mine location
+    # -   0 = - = 0 value (no adjacent mines)
+    # - 1-8 = Number of adjacent mines
+    self.playerViewBoard = np.full((self.xDimension, self.yDimension), CONST_TILE_UNKNOWN, dtype=np.int8)
+
+    # Flags placed by the player on hidden tiles
+    self.flagBoard = np.zeros((self.xDimension, self.yDimension), dtype=bool)
 
     # Seed the board with mines and then determine the correct values
     # to assign for the remaining nodes based on adjacency to mines
-    self.__seedMines()
+    self.__seedMines(mineIndices)
     self.__seedValues()
 
   def isGameOver(self):
@@ -57,23 +175,77 @@ class MineSweeperBoard:
     """
     return self.gameOver
 
-  def __seedMines(self):
+  def checkpoint(self):
+    """Marks the current state of the game so it can be restored later
+
+    The game state board never changes once it has been seeded, so
+    only the moves made after a checkpoint need to be recorded. From
+    the first checkpoint on, every move appends its move delta to an
+    undo journal, and every flag toggle the tile it toggled; rollback()
+    uses it to hide the revealed tiles again and to undo the toggles.
+    Taking a checkpoint is O(1) and restoring one costs time
+    proportional to the number of tiles revealed and flags toggled
+    since, regardless of the size of the board. Checkpoints can be
+    nested.
+
+    Returns
+    -------
+    int
+      The checkpoint to pass to rollback()
+    """
+    if self.journal is None:
+      self.journal = []
+    return len(self.journal)
+
+  def rollback(self, checkpoint):
+    """Restores the game to the state it was in at a checkpoint
+
+    Checkpoints taken after the restored one are discarded, while the
+    restored checkpoint (and any taken before it) remains valid.
+
+    Parameters
+    ----------
+    checkpoint : int
+      A checkpoint returned by checkpoint()
+    """
+    if self.journal is None or checkpoint < 0 or checkpoint > len(self.journal):
+      raise ValueError('invalid checkpoint entered')
+    playerView = self.playerViewBoard.reshape(-1)
+    while len(self.journal) > checkpoint:
+      movesRemaining, gameOver, moveDelta, flaggedTile = self.journal.pop()
+      # Every tile in a move delta was hidden before the move was made
+      for x, y, value in moveDelta:
+        playerView[x * self.yDimension + y] = CONST_TILE_UNKNOWN
+      if flaggedTile is not None:
+        self.flagBoard[flaggedTile] = not self.flagBoard[flaggedTile]
+      self.movesRemaining = movesRemaining
+      self.gameOver = gameOver
+
+  def clearJournal(self):
+    """Discards every checkpoint and stops recording moves
+    """
+    self.journal = None
+
+  def __seedMines(self, mineIndices=None):
     """Seeds mines into an empty gameStateBoard
 
     This function should only be called by the initialization
     function. Its sole purpose is to randomly create the
     specified number of mines on the board. In the gameStateBoard,
     mines are denoted by the value: -9
+
+    See sampleMineIndices() for how the locations are chosen.
+
+    Parameters
+    ----------
+    mineIndices : list, optional
+      Explicit flat indices of the mines to use instead of random ones
     """
-    minesRemaining = self.numberMines
-    while minesRemaining > 0:
-      x = random.randint(0, self.xDimension - 1)
-      y = random.randint(0, self.yDimension - 1)
-      if self.gameStateBoard[x][y] == -9:
-        continue
-      self.gameStateBoard[x][y] = -9
-      self.mineCoordinates.append((x, y))
-      minesRemaining -= 1
+    if mineIndices is None:
+      mineIndices = sampleMineIndices(self.rng, self.xDimension * self.yDimension, self.numberMines)
+    mineIndices = [int(index) for index in mineIndices]
+    self.gameStateBoard.reshape(-1)[mineIndices] = CONST_TILE_MINE
+    self.mineCoordinates = [divmod(index, self.yDimension) for index in mineIndices]
 
   def __seedValues(self):
     """Seeds values into tiles not containing mines in the gameStateBoard
@@ -83,17 +255,12 @@ class MineSweeperBoard:
     contain a mine, this function determines the number of mines
     adjacent to all tiles on the gameStateBoard. These values
     can range from 0 to 8
+
+    The neighbor counts are computed in a single vectorized pass
+    by countAdjacentMines()
     """
-    for x, row in enumerate(self.gameStateBoard):
-      for y, value in enumerate(row):
-        # If the tile contains a mine, we are not interested in it
-        # so go onto the next tile
-        if value == -9:
-          continue
-        # Otherwise, calculate the number of adjacent mines, so that
-        # value can then be assigned to the tile
-        tileValue = self.__getNumAdjMines(x, y)
-        self.gameStateBoard[x][y] = tileValue
+    mines = self.gameStateBoard == CONST_TILE_MINE
+    self.gameStateBoard = np.where(mines, np.int8(CONST_TILE_MINE), countAdjacentMines(mines))
 
   def print(self, gameboard=None):
     """Print the player gameboard
@@ -110,7 +277,7 @@ class MineSweeperBoard:
       The 2D array that should be printed if the user does
       not want to print the player's view.
     """
-    board = self.playerViewBoard if (gameboard == None) else gameboard
+    board = self.getPlayerBoard() if (gameboard is None) else gameboard
     print('\n')
     print('\n'.join([' '.join([str(cell) for cell in row]) for row in board]))
     print('\n')
@@ -122,7 +289,7 @@ class MineSweeperBoard:
     previously defined print() function and passing in the
     game state 2D array
     """
-    self.print(self.gameStateBoard)
+    self.print(self.gameStateBoard.tolist())
 
   def __hasMine(self, x, y):
     """Determines if a mine is present at the given location
@@ -137,19 +304,24 @@ class MineSweeperBoard:
     y : int
       y coordinate corresponding to the location to look for a mine
     """
-    return True if self.gameStateBoard[x][y] == -9 else False
+    return True if self.gameStateBoard[x, y] == CONST_TILE_MINE else False
 
-  def __revealMines(self):
+  def __revealMines(self, moveDelta):
     """Reveals all the mines on the player visible gameboard
 
     This function should only be called when the player selects a mine
     and the game is ready to end. It reveals all the mines on the player
     visible gameboard.
+
+    Parameters
+    ----------
+    moveDelta : list
+      The list that the revealed (x, y, value) tiles are appended to
     """
     for coordinatePair in self.mineCoordinates:
       xCoordinate = coordinatePair[0]
       yCoordinate = coordinatePair[1]
-      self.__revealTile(xCoordinate, yCoordinate)
+      self.__revealTile(xCoordinate, yCoordinate, moveDelta)
 
   def __coordinateCheck(self, x, y):
     """Checks to make sure that the coordinate pair is within bounds of the board
@@ -170,58 +342,7 @@ class MineSweeperBoard:
       return False
     return True
   
-  def __getNumAdjMines(self, x, y):
-    """Gets the number of mines adjacent to the tile located at coordinates
-
-    This is a helper function used by the __seedValues() function to
-    determine the number of mines adjacent to any given tile on the
-    game state board. The return value is an integer denoting the 
-    number of adjacent mines.
-
-    Parameters
-    ----------
-    x : int
-      x coordinate of the tile to search around
-    y : int
-      y coordinate of the tile to search around
-    """
-    totalNumMines = 0
-    ## Check the tile to the west
-    if (self.__coordinateCheck(x, y-1)):
-      if self.__hasMine(x, y-1):
-        totalNumMines += 1
-    ## Check the tile to the north-west
-    if (self.__coordinateCheck(x-1, y-1)):
-      if self.__hasMine(x-1, y-1):
-        totalNumMines += 1
-    ## Check the tile to the north
-    if (self.__coordinateCheck(x-1, y)):
-      if self.__hasMine(x-1, y):
-        totalNumMines += 1
-    ## Check the tile to the north-east
-    if (self.__coordinateCheck(x-1, y+1)):
-      if self.__hasMine(x-1, y+1):
-        totalNumMines += 1
-    ## Check the tile to the east
-    if (self.__coordinateCheck(x, y+1)):
-      if self.__hasMine(x, y+1):
-        totalNumMines += 1
-    ## Check the tile to the south-east
-    if (self.__coordinateCheck(x+1, y+1)):
-      if self.__hasMine(x+1, y+1):
-        totalNumMines += 1
-    ## Check the tile to the south
-    if (self.__coordinateCheck(x+1, y)):
-      if self.__hasMine(x+1, y):
-        totalNumMines += 1
-    ## Check the tile to the south-west
-    if (self.__coordinateCheck(x+1, y-1)):
-      if self.__hasMine(x+1, y-1):
-        totalNumMines += 1
-    ## Return the total number of adjacent mines found
-    return totalNumMines
-
-  def __revealTile(self, x, y):
+  def __revealTile(self, x, y, moveDelta):
     """Reveals the tile specified by the input coordinates
 
     This is a helper function that reveals the tile found at
@@ -233,16 +354,15 @@ class MineSweeperBoard:
       x coordinate of the coordinate pair to reveal
     y : int
       y coordinate of the coordinate pair to reveal
+    moveDelta : list
+      The list that the revealed (x, y, value) tile is appended to
     """
-    # If the gameStateBoard contains a mine at the input coordinates,
-    # show a mine on the playerViewBoard
-    if self.gameStateBoard[x][y] == -9:
-      self.playerViewBoard[x][y] = 'x'
-    elif self.gameStateBoard[x][y] == 0:
-      self.playerViewBoard[x][y] = '-'
-      self.movesRemaining -= 1
-    else:
-      self.playerViewBoard[x][y] = self.gameStateBoard[x][y]
+    # Copy the tile code onto the playerViewBoard; only tiles that
+    # do not contain a mine count towards the remaining moves
+    tileValue = self.gameStateBoard[x, y]
+    self.playerViewBoard[x, y] = tileValue
+    moveDelta.append((x, y, CONST_PLAYER_SYMBOLS[tileValue - CONST_TILE_MINE]))
+    if tileValue != CONST_TILE_MINE:
       self.movesRemaining -= 1
 
   def __hasBeenPlayed(self, x, y):
@@ -255,16 +375,24 @@ class MineSweeperBoard:
     y : int
       y coordinate of the tile to check
     """
-    return False if self.playerViewBoard[x][y] == '@' else True
+    return False if self.playerViewBoard[x, y] == CONST_TILE_UNKNOWN else True
 
-  def __uncoverAdjTiles(self, x, y):
+  def __uncoverAdjTiles(self, x, y, moveDelta):
     """Uncovers tiles adjacent to the coordinates of the tile provided
 
     This function is used when the player selects a '0' tile on the
     game state board. Traditionally, minesweeper will reveal all
     adjacent tiles when a 0 tile is chosen. Furthermore, if any of the
-    revealed tiles are 0 tiles themselves, then __uncoverAdjTiles() will
-    be called on that tile.
+    revealed tiles are 0 tiles themselves, then their adjacent tiles
+    are uncovered as well.
+
+    The region is revealed with an iterative scanline fill instead of
+    recursion: each horizontal run of zero tiles is extended along its
+    row, then the rows above, through and below it are swept once to
+    reveal the bordering tiles and collect new runs. Every zero tile
+    belongs to exactly one run, so the fill is linear in the size of
+    the region and large open regions cannot exceed Python's
+    recursion limit.
 
     Parameters
     ----------
@@ -272,101 +400,245 @@ class MineSweeperBoard:
       x coordinate of the tile that is the center of the tiles to be uncovered
     y : int
       y coordinate of the tile that is the center of the tiles to be uncovered
+    moveDelta : list
+      The list that the revealed (x, y, value) tiles are appended to
     """
     # Ensure that the input coordinates belong to a tile containing a
     # zero value (i.e. no adjacent mines)
-    if self.gameStateBoard[x][y] == 0:
-      ## Check the tile to the west
-      if (self.__coordinateCheck(x, y-1)):
-        if not self.__hasBeenPlayed(x, y-1):
-          self.__revealTile(x, y-1)
-          self.__uncoverAdjTiles(x, y-1)
-      ## Check the tile to the north-west
-      if (self.__coordinateCheck(x-1, y-1)):
-        if not self.__hasBeenPlayed(x-1, y-1):
-          self.__revealTile(x-1, y-1)
-          self.__uncoverAdjTiles(x-1, y-1)
-      ## Check the tile to the north
-      if (self.__coordinateCheck(x-1, y)):
-        if not self.__hasBeenPlayed(x-1, y):
-          self.__revealTile(x-1, y)
-          self.__uncoverAdjTiles(x-1, y)
-      ## Check the tile to the north-east
-      if (self.__coordinateCheck(x-1, y+1)):
-        if not self.__hasBeenPlayed(x-1, y+1):
-          self.__revealTile(x-1, y+1)
-          self.__uncoverAdjTiles(x-1, y+1)
-      ## Check the tile to the east
-      if (self.__coordinateCheck(x, y+1)):
-        if not self.__hasBeenPlayed(x, y+1):
-          self.__revealTile(x, y+1)
-          self.__uncoverAdjTiles(x, y+1)
-      ## Check the tile to the south-east
-      if (self.__coordinateCheck(x+1, y+1)):
-        if not self.__hasBeenPlayed(x+1, y+1):
-          self.__revealTile(x+1, y+1)
-          self.__uncoverAdjTiles(x+1, y+1)
-      ## Check the tile to the south
-      if (self.__coordinateCheck(x+1, y)):
-        if not self.__hasBeenPlayed(x+1, y):
-          self.__revealTile(x+1, y)
-          self.__uncoverAdjTiles(x+1, y)
-      ## Check the tile to the south-west
-      if (self.__coordinateCheck(x+1, y-1)):
-        if not self.__hasBeenPlayed(x+1, y-1):
-          self.__revealTile(x+1, y-1)
-          self.__uncoverAdjTiles(x+1, y-1)
-
-  def makeMove(self, x, y):
-    """A public function called by the user when they have selected their tile.
-    
-    This is a public function that the player calls when they have selected a tile
-    to uncover for their move. This function sanitizes the user input before
-    making the corresponding changes to all three game boards.
+    if self.gameStateBoard[x, y] != 0:
+      return
+    # Flat memoryviews give cheap scalar access to both boards
+    gameState = memoryview(self.gameStateBoard.reshape(-1))
+    playerView = memoryview(self.playerViewBoard.reshape(-1))
+    yDimension = self.yDimension
+    numRevealed = 0
+    runs = [(x, y, y)]
+    while runs:
+      runX, left, right = runs.pop()
+      # Extend the run along its row over zero tiles that have not
+      # been revealed yet
+      rowOffset = runX * yDimension
+      while left > 0 and playerView[rowOffset + left - 1] == CONST_TILE_UNKNOWN and gameState[rowOffset + left - 1] == 0:
+        left -= 1
+        playerView[rowOffset + left] = 0
+        moveDelta.append((runX, left, '-'))
+        numRevealed += 1
+      while right < yDimension - 1 and playerView[rowOffset + right + 1] == CONST_TILE_UNKNOWN and gameState[rowOffset + right + 1] == 0:
+        right += 1
+        playerView[rowOffset + right] = 0
+        moveDelta.append((runX, right, '-'))
+        numRevealed += 1
+      # Reveal every hidden tile bordering the run; a zero tile never
+      # borders a mine, so all of these tiles are safe. Hidden zero
+      # tiles found along the way start new runs
+      firstColumn = max(left - 1, 0)
+      lastColumn = min(right + 2, yDimension)
+      for nx in range(max(runX - 1, 0), min(runX + 2, self.xDimension)):
+        rowOffset = nx * yDimension
+        runStart = -1
+        for ny in range(firstColumn, lastColumn):
+          index = rowOffset + ny
+          if playerView[index] == CONST_TILE_UNKNOWN:
+            tileValue = gameState[index]
+            playerView[index] = tileValue
+            moveDelta.append((nx, ny, CONST_PLAYER_SYMBOLS[tileValue - CONST_TILE_MINE]))
+            numRevealed += 1
+            if tileValue == 0:
+              if runStart < 0:
+                runStart = ny
+              continue
+          if runStart >= 0:
+            runs.append((nx, runStart, ny - 1))
+            runStart = -1
+        if runStart >= 0:
+          runs.append((nx, runStart, lastColumn - 1))
+    self.movesRemaining -= numRevealed
+
+  def toggleFlag(self, x, y):
+    """Places or removes a flag on an unrevealed tile
+
+    Flagged tiles cannot be played until the flag is removed, and
+    chord() uses the flags to decide which neighbors are safe.
 
     Parameters
     ----------
     x : int
-      x coordinate of the tile selected
+      x coordinate of the tile to flag
     y : int
-      y coordinate of the tile selected
+      y coordinate of the tile to flag
     """
-    # Sanitize the user input coordinates
     if not self.__coordinateCheck(x, y):
       raise ValueError('invalid coordinate pair chosen')
-    # Check if the move has already been made
     if self.__hasBeenPlayed(x, y):
       raise ValueError('move has already been played')
+    if self.journal is not None:
+      self.journal.append((self.movesRemaining, self.gameOver, [], (x, y)))
+    self.flagBoard[x, y] = not self.flagBoard[x, y]
+
+  def __isFlagged(self, x, y):
+    """Checks whether a hidden tile carries a flag
+
+    Flags left on tiles revealed by a zero region are ignored.
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the tile to check
+    y : int
+      y coordinate of the tile to check
+    """
+    return self.flagBoard[x, y] and not self.__hasBeenPlayed(x, y)
+
+  def __playTile(self, x, y, moveDelta):
+    """Plays a hidden, unflagged tile and reveals what the move uncovers
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the tile selected
+    y : int
+      y coordinate of the tile selected
+    moveDelta : list
+      The list that the revealed (x, y, value) tiles are appended to
+    """
     # Check if the player has hit a mine
     if self.__hasMine(x, y):
-      self.__revealMines()
+      self.__revealMines(moveDelta)
       self.gameOver = True
-      print('player has hit a mine!')
+      self.renderer.renderMessage('player has hit a mine!')
     # If a player selects a tile with a zero value
     # (i.e. no adjacent tiles contain a mine), uncover
     # all adjacent tiles
-    elif self.gameStateBoard[x][y] == 0:
-      self.__revealTile(x,y)
-      self.__uncoverAdjTiles(x,y)
+    elif self.gameStateBoard[x, y] == 0:
+      self.__revealTile(x, y, moveDelta)
+      self.__uncoverAdjTiles(x, y, moveDelta)
       # If there are no move valid moves the player can make
       # then the game is over; the player has won!
       if self.movesRemaining == 0:
         self.gameOver = True
-        print('player has won!')
+        self.renderer.renderMessage('player has won!')
     # If the player selects a tile that contains a
     # non-negative, non-zero value - then just reveal
     # that single tile
-    elif self.gameStateBoard[x][y] > 0:
-      self.__revealTile(x,y)
+    elif self.gameStateBoard[x, y] > 0:
+      self.__revealTile(x, y, moveDelta)
       if self.movesRemaining == 0:
         self.gameOver = True
-        print('player has won')
+        self.renderer.renderMessage('player has won')
+
+  def __startMove(self):
+    """Creates the move delta of a move and records it in the undo journal
+    """
+    moveDelta = []
+    if self.journal is not None:
+      self.journal.append((self.movesRemaining, self.gameOver, moveDelta, None))
+    return moveDelta
+
+  def makeMove(self, x, y):
+    """A public function called by the user when they have selected their tile.
+    
+    This is a public function that the player calls when they have selected a tile
+    to uncover for their move. This function sanitizes the user input before
+    making the corresponding changes to all three game boards.
+
+    The tiles revealed by the move are returned as a move delta, a list of
+    (x, y, value) tuples using the same symbols as getPlayerBoard(). Passing
+    it to MineSweeperPlayer.applyMoveDelta() keeps the player in sync at a
+    cost proportional to the number of tiles revealed.
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the tile selected
+    y : int
+      y coordinate of the tile selected
+
+    Returns
+    -------
+    list
+      The (x, y, value) tuples of every tile revealed by the move
+    """
+    # Sanitize the user input coordinates
+    if not self.__coordinateCheck(x, y):
+      raise ValueError('invalid coordinate pair chosen')
+    # Check if the move has already been made
+    if self.__hasBeenPlayed(x, y):
+      raise ValueError('move has already been played')
+    if self.__isFlagged(x, y):
+      raise ValueError('tile has been flagged')
+    moveDelta = self.__startMove()
+    self.__playTile(x, y, moveDelta)
+    return moveDelta
+
+  def makeMoves(self, moves):
+    """Plays several tiles in a single call
+
+    The moves are played in order until one of them hits a mine or the
+    game is won. Tiles that were uncovered by an earlier move of the
+    same call are skipped, so a whole queue of safe tiles can be passed
+    in at once.
+
+    Parameters
+    ----------
+    moves : list
+      The (x, y) coordinates of the tiles to play
+
+    Returns
+    -------
+    list
+      The merged move delta of every tile revealed by the moves
+    """
+    # Sanitize every move before the board is changed
+    for x, y in moves:
+      if not self.__coordinateCheck(x, y):
+        raise ValueError('invalid coordinate pair chosen')
+    moveDelta = self.__startMove()
+    for x, y in moves:
+      if self.gameOver:
+        break
+      if not self.__hasBeenPlayed(x, y) and not self.__isFlagged(x, y):
+        self.__playTile(x, y, moveDelta)
+    return moveDelta
+
+  def chord(self, x, y):
+    """Plays every unflagged neighbor of a satisfied number tile
+
+    When the number of flags around a revealed number equals the
+    number, all of its other hidden neighbors are played at once. The
+    neighbors are played in order and the chord stops at the first
+    mine, which happens when a flag was placed on a safe tile. Nothing
+    is played if the flags do not match the number.
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the revealed number tile
+    y : int
+      y coordinate of the revealed number tile
+
+    Returns
+    -------
+    list
+      The merged move delta of every tile revealed by the chord
+    """
+    if not self.__coordinateCheck(x, y):
+      raise ValueError('invalid coordinate pair chosen')
+    if not self.__hasBeenPlayed(x, y):
+      raise ValueError('tile has not been played')
+    # A chord touches at most eight tiles, so they are found directly
+    # rather than through a neighbor table of the whole board
+    neighbors = [(nx, ny) for nx in range(x - 1, x + 2) for ny in range(y - 1, y + 2) if self.__coordinateCheck(nx, ny) and not self.__hasBeenPlayed(nx, ny)]
+    flagged = [neighbor for neighbor in neighbors if self.flagBoard[neighbor]]
+    if self.gameOver or self.playerViewBoard[x, y] != len(flagged):
+      return self.__startMove()
+    return self.makeMoves([neighbor for neighbor in neighbors if not self.flagBoard[neighbor]])
 
   def getPlayerBoard(self):
     """Returns the 2D playerViewBoard
 
-    This function returns the 2D playerViewBoard array so that
-    it can be passed to the AI player which will then make decisions
-    on the next move to play.
+    This function returns the 2D playerViewBoard as a list of lists
+    using the legacy symbols ('@', 'x', '-' and 1-8) so that it can be
+    passed to the AI player which will then make decisions on the
+    next move to play.
     """
-    return self.playerViewBoard
+    return CONST_PLAYER_SYMBOLS[self.playerViewBoard - CONST_TILE_MINE].tolist()
@@ -0,0 +1,386 @@
+# Import necessary Python libraries
+import numpy as np
+from MineSweeperRenderer import IncrementalRenderer
+from collections import OrderedDict, deque
+from MineSweeperBoard import CONST_TILE_MINE, CONST_PLAYER_SYMBOLS, sampleMineIndices, countAdjacentMines
+
+CONST_CHUNK_SIZE = 64
+CONST_CHUNK_MAX_RESIDENT = 1024
+
+class MineSweeperChunkedBoard:
+
+  def __init__(self, xDimension, yDimension, mineDensity, seed=0, chunkSize=CONST_CHUNK_SIZE, maxResidentChunks=CONST_CHUNK_MAX_RESIDENT, renderer=None):
+    """Initializes a lazily generated Minesweeper board
+
+    The board is split into square chunks of chunkSize x chunkSize
+    tiles. Nothing is generated up front: the mines of a chunk are
+    placed the first time any of its tiles (or the tiles bordering
+    it) are needed, using a random stream derived from the board seed
+    and the chunk coordinates. A chunk therefore always holds the same
+    mines no matter when or in which order it is generated, so the
+    generated chunks are kept in an LRU cache of bounded size and
+    simply regenerated after eviction. Only the revealed state of the
+    chunks the player has touched is kept permanently.
+
+    Parameters
+    ----------
+    xDimension : int
+      The number of rows the gameboard possesses; may be far larger
+      than what would fit in memory
+    yDimension : int
+      The number of columns the gameboard possesses
+    mineDensity : float
+      The fraction of the tiles of every chunk that contain a mine
+    seed : int, optional
+      The non-negative seed the chunk contents are derived from
+    chunkSize : int, optional
+      The side length of the square chunks
+    maxResidentChunks : int, optional
+      The maximum number of generated chunks kept in memory; at least
+      nine, since counting the mines next to a chunk needs all of the
+      chunks around it
+    renderer : MineSweeperRenderer, optional
+      The renderer that status messages are reported to (default is
+      an IncrementalRenderer writing to standard output)
+    """
+    self.xDimension = xDimension
+    self.yDimension = yDimension
+    self.mineDensity = mineDensity
+    self.seed = seed
+    self.chunkSize = chunkSize
+    self.maxResidentChunks = max(maxResidentChunks, 9)
+    self.renderer = renderer if renderer is not None else IncrementalRenderer()
+    self.gameOver = False
+
+    # Sanity check to make sure the density describes a valid board
+    if self.mineDensity < 0 or self.mineDensity > 1:
+      raise ValueError('invalid mine density entered')
+
+    # Every chunk holds a fixed number of mines for its size, so the
+    # total only depends on the (at most four) distinct chunk shapes
+    fullRows, edgeRows = divmod(self.xDimension, self.chunkSize)
+    fullCols, edgeCols = divmod(self.yDimension, self.chunkSize)
+    self.numberMines = 0
+    for numberRows, rowCount in ((self.chunkSize, fullRows), (edgeRows, 1 if edgeRows else 0)):
+      for numberCols, colCount in ((self.chunkSize, fullCols), (edgeCols, 1 if edgeCols else 0)):
+        self.numberMines += rowCount * colCount * self.__getChunkMineCount(numberRows, numberCols)
+    self.movesRemaining = (self.xDimension * self.yDimension) - self.numberMines
+    if self.movesRemaining == 0:
+      self.gameOver = True
+
+    # Generated chunks map (cx, cy) to [mines, adjacentCounts], where the
+    # counts are only computed once a tile of the chunk is revealed
+    self.chunkCache = OrderedDict()
+    self.chunksGenerated = 0
+    # Revealed tiles of every chunk the player has touched
+    self.revealedChunks = {}
+
+  def isGameOver(self):
+    """Returns whether the game has been marked as over
+    """
+    return self.gameOver
+
+  def __getChunkMineCount(self, numberRows, numberCols):
+    """Returns the number of mines placed in a chunk of the given shape
+
+    Parameters
+    ----------
+    numberRows : int
+      The number of rows of the chunk
+    numberCols : int
+      The number of columns of the chunk
+    """
+    return int(round(numberRows * numberCols * self.mineDensity))
+
+  def __getChunkShape(self, cx, cy):
+    """Returns the number of rows and columns of chunk (cx, cy)
+
+    Chunks along the bottom and right edges of the board are cut off
+    by the board dimensions.
+
+    Parameters
+    ----------
+    cx : int
+      Row index of the chunk
+    cy : int
+      Column index of the chunk
+    """
+    return (min(self.chunkSize, self.xDimension - cx * self.chunkSize), min(self.chunkSize, self.yDimension - cy * self.chunkSize))
+
+  def __getChunk(self, cx, cy):
+    """Returns the cache entry of chunk (cx, cy), generating its mines if needed
+
+    Parameters
+    ----------
+    cx : int
+      Row index of the chunk
+    cy : int
+      Column index of the chunk
+    """
+    chunk = self.chunkCache.get((cx, cy))
+    if chunk is not None:
+      self.chunkCache.move_to_end((cx, cy))
+      return chunk
+    numberRows, numberCols = self.__getChunkShape(cx, cy)
+    rng = np.random.default_rng([self.seed, cx, cy])
+    mines = np.zeros(numberRows * numberCols, dtype=bool)
+    mines[sampleMineIndices(rng, numberRows * numberCols, self.__getChunkMineCount(numberRows, numberCols))] = True
+    chunk = [mines.reshape(numberRows, numberCols), None]
+    self.chunksGenerated += 1
+    self.__storeChunk(cx, cy, chunk)
+    return chunk
+
+  def __storeChunk(self, cx, cy, chunk):
+    """Stores a chunk as the most recently used cache entry
+
+    The least recently used chunk is evicted once more than
+    maxResidentChunks chunks are resident.
+
+    Parameters
+    ----------
+    cx : int
+      Row index of the chunk
+    cy : int
+      Column index of the chunk
+    chunk : list
+      The [mines, adjacentCounts] entry of the chunk
+    """
+    self.chunkCache[(cx, cy)] = chunk
+    self.chunkCache.move_to_end((cx, cy))
+    if len(self.chunkCache) > self.maxResidentChunks:
+      self.chunkCache.popitem(last=False)
+
+  def __getChunkCounts(self, cx, cy):
+    """Returns the adjacent mine counts of chunk (cx, cy)
+
+    The mines of the chunk and of the chunks bordering it are stitched
+    into one slab with a one tile margin before counting.
+
+    Parameters
+    ----------
+    cx : int
+      Row index of the chunk
+    cy : int
+      Column index of the chunk
+    """
+    chunk = self.__getChunk(cx, cy)
+    if chunk[1] is not None:
+      return chunk[1]
+    numberRows, numberCols = chunk[0].shape
+    slab = np.zeros((numberRows + 2, numberCols + 2), dtype=bool)
+    for dx in (-1, 0, 1):
+      for dy in (-1, 0, 1):
+        nx, ny = cx + dx, cy + dy
+        if nx < 0 or ny < 0 or nx * self.chunkSize >= self.xDimension or ny * self.chunkSize >= self.yDimension:
+          continue
+        mines = self.__getChunk(nx, ny)[0]
+        # Rows and columns of the neighboring chunk that fall in the slab
+        rowSource = slice(None) if dx == 0 else (slice(-1, None) if dx < 0 else slice(0, 1))
+        colSource = slice(None) if dy == 0 else (slice(-1, None) if dy < 0 else slice(0, 1))
+        rowTarget = slice(1, numberRows + 1) if dx == 0 else (slice(0, 1) if dx < 0 else slice(numberRows + 1, numberRows + 2))
+        colTarget = slice(1, numberCols + 1) if dy == 0 else (slice(0, 1) if dy < 0 else slice(numberCols + 1, numberCols + 2))
+        slab[rowTarget, colTarget] = mines[rowSource, colSource]
+    counts = countAdjacentMines(slab)[1:-1, 1:-1]
+    chunk[1] = np.where(slab[1:-1, 1:-1], np.int8(CONST_TILE_MINE), counts)
+    # Loading the neighbors may have evicted the chunk itself, so it is
+    # stored again as the most recently used entry
+    self.__storeChunk(cx, cy, chunk)
+    return chunk[1]
+
+  def __getTileValue(self, x, y):
+    """Returns the game state code of tile (x, y)
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the tile
+    y : int
+      y coordinate of the tile
+    """
+    cx, tx = divmod(x, self.chunkSize)
+    cy, ty = divmod(y, self.chunkSize)
+    return int(self.__getChunkCounts(cx, cy)[tx, ty])
+
+  def __hasBeenPlayed(self, x, y):
+    """Returns whether tile (x, y) has been revealed
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the tile
+    y : int
+      y coordinate of the tile
+    """
+    cx, tx = divmod(x, self.chunkSize)
+    cy, ty = divmod(y, self.chunkSize)
+    revealed = self.revealedChunks.get((cx, cy))
+    return revealed is not None and bool(revealed[tx, ty])
+
+  def __revealTile(self, x, y, moveDelta):
+    """Reveals tile (x, y) and returns its game state code
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the tile
+    y : int
+      y coordinate of the tile
+    moveDelta : list
+      The list that the revealed (x, y, value) tile is appended to
+    """
+    cx, tx = divmod(x, self.chunkSize)
+    cy, ty = divmod(y, self.chunkSize)
+    revealed = self.revealedChunks.get((cx, cy))
+    if revealed is None:
+      revealed = np.zeros(self.__getChunkShape(cx, cy), dtype=bool)
+      self.revealedChunks[(cx, cy)] = revealed
+    revealed[tx, ty] = True
+    tileValue = self.__getTileValue(x, y)
+    moveDelta.append((x, y, CONST_PLAYER_SYMBOLS[tileValue - CONST_TILE_MINE]))
+    if tileValue != CONST_TILE_MINE:
+      self.movesRemaining -= 1
+    return tileValue
+
+  def __uncoverAdjTiles(self, x, y, moveDelta):
+    """Uncovers the region of tiles around the zero tile (x, y)
+
+    The region is explored breadth first with an explicit queue, so
+    it may span any number of chunks without recursion.
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the zero tile at the center of the region
+    y : int
+      y coordinate of the zero tile at the center of the region
+    moveDelta : list
+      The list that the revealed (x, y, value) tiles are appended to
+    """
+    queue = deque([(x, y)])
+    while queue:
+      cx, cy = queue.popleft()
+      for nx in range(max(cx - 1, 0), min(cx + 2, self.xDimension)):
+        for ny in range(max(cy - 1, 0), min(cy + 2, self.yDimension)):
+          if self.__hasBeenPlayed(nx, ny):
+            continue
+          if self.__revealTile(nx, ny, moveDelta) == 0:
+            queue.append((nx, ny))
+
+  def makeMove(self, x, y):
+    """A public function called by the user when they have selected their tile.
+
+    This function behaves like MineSweeperBoard.makeMove(), except that
+    hitting a mine only reveals that mine: the rest of the board may
+    never have been generated.
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the tile selected
+    y : int
+      y coordinate of the tile selected
+
+    Returns
+    -------
+    list
+      The (x, y, value) tuples of every tile revealed by the move
+    """
+    # Sanitize the user input coordinates
+    if x < 0 or x >= self.xDimension or y < 0 or y >= self.yDimension:
+      raise ValueError('invalid coordinate pair chosen')
+    # Check if the move has already been made
+    if self.__hasBeenPlayed(x, y):
+      raise ValueError('move has already been played')
+    moveDelta = []
+    tileValue = self.__revealTile(x, y, moveDelta)
+    if tileValue == CONST_TILE_MINE:
+      self.gameOver = True
+      self.renderer.renderMessage('player has hit a mine!')
+      return moveDelta
+    if tileValue == 0:
+      self.__uncoverAdjTiles(x, y, moveDelta)
+    if self.movesRemaining == 0:
+      self.gameOver = True
+      self.renderer.renderMessage('player has won!')
+    return moveDelta
+
+  def makeMoves(self, moves):
+    """Plays several tiles in a single call
+
+    This function behaves like MineSweeperBoard.makeMoves(): the moves
+    are played in order until the game is over, skipping tiles that
+    have already been revealed.
+
+    Parameters
+    ----------
+    moves : list
+      The (x, y) coordinates of the tiles to play
+
+    Returns
+    -------
+    list
+      The merged move delta of every tile revealed by the moves
+    """
+    # Sanitize every move before the board is changed
+    for x, y in moves:
+      if x < 0 or x >= self.xDimension or y < 0 or y >= self.yDimension:
+        raise ValueError('invalid coordinate pair chosen')
+    moveDelta = []
+    for x, y in moves:
+      if self.gameOver:
+        break
+      if not self.__hasBeenPlayed(x, y):
+        moveDelta.extend(self.makeMove(x, y))
+    return moveDelta
+
+  def getPlayerWindow(self, x, y, numberRows, numberCols):
+    """Returns part of the playerViewBoard as a list of lists
+
+    Only the chunks holding revealed tiles inside the window are
+    consulted, so viewing untouched parts of the board is free.
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the top left tile of the window
+    y : int
+      y coordinate of the top left tile of the window
+    numberRows : int
+      The number of rows in the window
+    numberCols : int
+      The number of columns in the window
+    """
+    window = [['@' for ny in range(y, y + numberCols)] for nx in range(x, x + numberRows)]
+    for cx in range(x // self.chunkSize, (x + numberRows - 1) // self.chunkSize + 1):
+      for cy in range(y // self.chunkSize, (y + numberCols - 1) // self.chunkSize + 1):
+        revealed = self.revealedChunks.get((cx, cy))
+        if revealed is None:
+          continue
+        rowOffset, colOffset = cx * self.chunkSize, cy * self.chunkSize
+        for tx, ty in np.argwhere(revealed).tolist():
+          nx, ny = rowOffset + tx - x, colOffset + ty - y
+          if 0 <= nx < numberRows and 0 <= ny < numberCols:
+            window[nx][ny] = CONST_PLAYER_SYMBOLS[self.__getTileValue(rowOffset + tx, colOffset + ty) - CONST_TILE_MINE]
+    return window
+
+  def getPlayerBoard(self):
+    """Returns the whole 2D playerViewBoard
+
+    This is only practical for boards small enough to hold in memory
+    as lists; use getPlayerWindow() on large boards.
+    """
+    return self.getPlayerWindow(0, 0, self.xDimension, self.yDimension)
+
+  def print(self, gameboard=None):
+    """Print the player gameboard
+
+    Parameters
+    ----------
+    gameboard : array, optional
+      The 2D array that should be printed if the user does
+      not want to print the player's view.
+    """
+    board = self.getPlayerBoard() if (gameboard is None) else gameboard
+    print('\n')
+    print('\n'.join([' '.join([str(cell) for cell in row]) for row in board]))
+    print('\n')
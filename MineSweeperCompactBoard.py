@@ -0,0 +1,451 @@
+# Import necessary Python libraries
+import numpy as np
+from MineSweeperRenderer import IncrementalRenderer
+from MineSweeperBoard import CONST_TILE_MINE, CONST_TILE_UNKNOWN, CONST_PLAYER_SYMBOLS, sampleMineIndices, countAdjacentMines
+
+# Number of set bits in every possible byte value
+CONST_POPCOUNT_TABLE = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+# Boards are generated and decoded in strips of roughly this many
+# tiles, which bounds the temporary memory needed on huge boards
+CONST_COMPACT_STRIP_TILES = 1 << 20
+
+class MineSweeperCompactBoard:
+
+  def __init__(self, xDimension, yDimension, numberMines, seed=None, renderer=None):
+    """Initializes a bit-packed Minesweeper board
+
+    The board offers the moves and flags of MineSweeperBoard, though
+    not its checkpoints or chord(), but keeps the mine, revealed and
+    flag states of each tile as single bits and the number of adjacent
+    mines as a 4-bit value, for under one byte per tile in total.
+
+    Parameters
+    ----------
+    xDimension : int
+      The number of rows the gameboard possesses
+    yDimension : int
+      The number of columns the gameboard possesses
+    numberMines : int
+      The number of mines that the board contains. The
+      number should be positive, but less than the total
+      number tiles the board has
+    seed : int or numpy.random.Generator, optional
+      The seed (or random number generator) used to place the
+      mines. Boards created with the same seed are identical
+    renderer : MineSweeperRenderer, optional
+      The renderer that status messages are reported to (default is
+      an IncrementalRenderer writing to standard output)
+    """
+    self.xDimension = xDimension
+    self.yDimension = yDimension
+    self.numberMines = numberMines
+    self.rng = np.random.default_rng(seed)
+    self.renderer = renderer if renderer is not None else IncrementalRenderer()
+    self.gameOver = False
+
+    # Sanity check to make sure that there are not more mines
+    # than actual tiles on the game board
+    if ((self.numberMines > (self.xDimension * self.yDimension)) or self.numberMines < 0):
+      raise ValueError('invalid number of mines entered')
+
+    # Every row of the bitsets starts on a byte boundary. Bit y % 8 of
+    # byte y // 8 holds the state of column y
+    self.rowBytes = (self.yDimension + 7) // 8
+    self.mineBits = np.zeros((self.xDimension, self.rowBytes), dtype=np.uint8)
+    self.revealedBits = np.zeros((self.xDimension, self.rowBytes), dtype=np.uint8)
+    self.flagBits = np.zeros((self.xDimension, self.rowBytes), dtype=np.uint8)
+    # Running popcount of revealedBits, updated from the bytes each move
+    # touches so the win check does not scan the whole bitset
+    self.numberRevealed = 0
+    # Adjacent mine counts are packed two per byte: even columns in
+    # the low nibble and odd columns in the high nibble
+    self.rowNibbleBytes = (self.yDimension + 1) // 2
+    self.adjacentCounts = np.zeros((self.xDimension, self.rowNibbleBytes), dtype=np.uint8)
+
+    # Seed the board with mines and then determine the correct values
+    # to assign for the remaining nodes based on adjacency to mines
+    self.__seedMines()
+    self.__seedValues()
+    if self.numberMines == self.xDimension * self.yDimension:
+      self.gameOver = True
+
+  def isGameOver(self):
+    """Returns whether the game has been marked as over
+    """
+    return self.gameOver
+
+  def __strips(self):
+    """Splits the rows of the board into strips of bounded size
+
+    Returns
+    -------
+    list
+      (firstRow, lastRow) pairs of each strip, with lastRow exclusive
+    """
+    stripRows = max(1, CONST_COMPACT_STRIP_TILES // max(self.yDimension, 1))
+    return [(row, min(row + stripRows, self.xDimension)) for row in range(0, self.xDimension, stripRows)]
+
+  def __seedMines(self):
+    """Seeds mines into the empty mine bitset
+
+    This function should only be called by the initialization
+    function. The number of mines in each strip of rows is drawn
+    from a multivariate hypergeometric distribution and the mines
+    are then placed within each strip by sampleMineIndices(), so
+    placement stays proportional to the number of mines without
+    ever materializing the whole board.
+    """
+    strips = self.__strips()
+    stripTiles = [(lastRow - firstRow) * self.yDimension for firstRow, lastRow in strips]
+    stripMines = self.rng.multivariate_hypergeometric(stripTiles, self.numberMines)
+    for (firstRow, lastRow), numberTiles, numberMines in zip(strips, stripTiles, stripMines.tolist()):
+      mines = np.zeros(numberTiles, dtype=bool)
+      mines[sampleMineIndices(self.rng, numberTiles, numberMines)] = True
+      self.mineBits[firstRow:lastRow] = np.packbits(mines.reshape(lastRow - firstRow, self.yDimension), axis=1, bitorder='little')
+
+  def __seedValues(self):
+    """Seeds the packed adjacent mine counts
+
+    This function should only be called by the initialization
+    function. Each strip is unpacked together with the rows
+    bordering it, counted with countAdjacentMines() and packed
+    back into nibbles.
+    """
+    for firstRow, lastRow in self.__strips():
+      paddedFirstRow = max(firstRow - 1, 0)
+      mines = self.__unpackBits(self.mineBits, paddedFirstRow, min(lastRow + 1, self.xDimension))
+      counts = countAdjacentMines(mines)[firstRow - paddedFirstRow:lastRow - paddedFirstRow].astype(np.uint8)
+      if self.yDimension % 2:
+        counts = np.pad(counts, ((0, 0), (0, 1)))
+      self.adjacentCounts[firstRow:lastRow] = counts[:, 0::2] | (counts[:, 1::2] << 4)
+
+  def __unpackBits(self, bits, firstRow, lastRow):
+    """Unpacks rows of a bitset into a boolean array
+
+    Parameters
+    ----------
+    bits : numpy.ndarray
+      One of the mine, revealed or flag bitsets
+    firstRow : int
+      The first row to unpack
+    lastRow : int
+      The row after the last row to unpack
+    """
+    return np.unpackbits(bits[firstRow:lastRow], axis=1, count=self.yDimension, bitorder='little').astype(bool)
+
+  def __unpackCounts(self, firstRow, lastRow):
+    """Unpacks rows of the adjacent mine counts into an int8 array
+
+    Parameters
+    ----------
+    firstRow : int
+      The first row to unpack
+    lastRow : int
+      The row after the last row to unpack
+    """
+    packed = self.adjacentCounts[firstRow:lastRow]
+    counts = np.empty((lastRow - firstRow, 2 * self.rowNibbleBytes), dtype=np.int8)
+    counts[:, 0::2] = packed & 15
+    counts[:, 1::2] = packed >> 4
+    return counts[:, :self.yDimension]
+
+  def __getPlayerCodes(self, firstRow, lastRow):
+    """Decodes rows of the board into playerViewBoard tile codes
+
+    Parameters
+    ----------
+    firstRow : int
+      The first row to decode
+    lastRow : int
+      The row after the last row to decode
+    """
+    revealed = self.__unpackBits(self.revealedBits, firstRow, lastRow)
+    mines = self.__unpackBits(self.mineBits, firstRow, lastRow)
+    codes = np.where(mines, np.int8(CONST_TILE_MINE), self.__unpackCounts(firstRow, lastRow))
+    return np.where(revealed, codes, np.int8(CONST_TILE_UNKNOWN))
+
+  def countRevealed(self):
+    """Returns the number of revealed tiles, computed as a popcount
+
+    This scans the whole bitset, so moves keep numberRevealed up to
+    date instead; this full count is there to verify it.
+    """
+    return int(CONST_POPCOUNT_TABLE[self.revealedBits].sum(dtype=np.int64))
+
+  def memoryUsage(self):
+    """Returns the number of bytes used to store the board state
+    """
+    return self.mineBits.nbytes + self.revealedBits.nbytes + self.flagBits.nbytes + self.adjacentCounts.nbytes
+
+  def print(self, gameboard=None):
+    """Print the player gameboard
+
+    This function prints the players representation of
+    the minesweeper gameboard as a n x m matrix. By
+    default, the function will print the player's view
+    of the gameboard; however, if a 2D array is passed-in,
+    it will print that instead.
+
+    Parameters
+    ----------
+    gameboard : array, optional
+      The 2D array that should be printed if the user does
+      not want to print the player's view.
+    """
+    board = self.getPlayerBoard() if (gameboard is None) else gameboard
+    print('\n')
+    print('\n'.join([' '.join([str(cell) for cell in row]) for row in board]))
+    print('\n')
+
+  def printDebug(self):
+    """Prints the game state board
+
+    The mines and adjacent mine counts are decoded into the
+    same numbers used by MineSweeperBoard.gameStateBoard
+    """
+    mines = self.__unpackBits(self.mineBits, 0, self.xDimension)
+    self.print(np.where(mines, np.int8(CONST_TILE_MINE), self.__unpackCounts(0, self.xDimension)).tolist())
+
+  def __coordinateCheck(self, x, y):
+    """Checks to make sure that the coordinate pair is within bounds of the board
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the coordinate pair to check
+    y : int
+      y coordinate of the coordinate pair to check
+    """
+    if x < 0 or x >= self.xDimension:
+      return False
+    if y < 0 or y >= self.yDimension:
+      return False
+    return True
+
+  def __hasBit(self, bits, x, y):
+    """Returns whether the bit of tile (x, y) is set in a bitset
+
+    Parameters
+    ----------
+    bits : numpy.ndarray
+      One of the mine, revealed or flag bitsets
+    x : int
+      x coordinate of the tile
+    y : int
+      y coordinate of the tile
+    """
+    return bool((bits[x, y >> 3] >> (y & 7)) & 1)
+
+  def __getTileValue(self, x, y):
+    """Returns the number of mines adjacent to tile (x, y)
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the tile
+    y : int
+      y coordinate of the tile
+    """
+    return (int(self.adjacentCounts[x, y >> 1]) >> ((y & 1) << 2)) & 15
+
+  def toggleFlag(self, x, y):
+    """Places or removes a flag on an unrevealed tile
+
+    Flagged tiles cannot be played until the flag is removed.
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the tile to flag
+    y : int
+      y coordinate of the tile to flag
+    """
+    if not self.__coordinateCheck(x, y):
+      raise ValueError('invalid coordinate pair chosen')
+    if self.__hasBit(self.revealedBits, x, y):
+      raise ValueError('move has already been played')
+    self.flagBits[x, y >> 3] ^= 1 << (y & 7)
+
+  def __revealMines(self, moveDelta):
+    """Reveals all the mines on the player visible gameboard
+
+    This function should only be called when the player selects a mine
+    and the game is ready to end.
+
+    Parameters
+    ----------
+    moveDelta : list
+      The list that the revealed (x, y, value) tiles are appended to
+    """
+    for firstRow, lastRow in self.__strips():
+      hidden = ~self.__unpackBits(self.revealedBits, firstRow, lastRow)
+      xMines, yMines = np.nonzero(self.__unpackBits(self.mineBits, firstRow, lastRow) & hidden)
+      moveDelta.extend((firstRow + x, y, 'x') for x, y in zip(xMines.tolist(), yMines.tolist()))
+    self.revealedBits |= self.mineBits
+    self.numberRevealed = self.countRevealed()
+
+  def __uncoverAdjTiles(self, x, y, moveDelta, touchedBytes):
+    """Uncovers tiles adjacent to the coordinates of the tile provided
+
+    This is the bit-packed counterpart of the scanline fill used by
+    MineSweeperBoard: each horizontal run of zero tiles is extended
+    along its row, then the rows around it are swept once to reveal
+    the bordering tiles and collect new runs. Flags on revealed tiles
+    are cleared.
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the zero tile at the center of the region
+    y : int
+      y coordinate of the zero tile at the center of the region
+    moveDelta : list
+      The list that the revealed (x, y, value) tiles are appended to
+    touchedBytes : dict
+      Maps the index of every revealed byte changed by the move to its
+      value before the move
+    """
+    revealedBits = memoryview(self.revealedBits.reshape(-1))
+    flagBits = memoryview(self.flagBits.reshape(-1))
+    adjacentCounts = memoryview(self.adjacentCounts.reshape(-1))
+    rowBytes = self.rowBytes
+    rowNibbleBytes = self.rowNibbleBytes
+    yDimension = self.yDimension
+
+    def revealIfHidden(nx, ny):
+      """Reveals a hidden tile and returns its value, or -1 if already revealed"""
+      byteIndex = nx * rowBytes + (ny >> 3)
+      bit = 1 << (ny & 7)
+      if revealedBits[byteIndex] & bit:
+        return -1
+      if byteIndex not in touchedBytes:
+        touchedBytes[byteIndex] = revealedBits[byteIndex]
+      revealedBits[byteIndex] |= bit
+      if flagBits[byteIndex] & bit:
+        flagBits[byteIndex] ^= bit
+      tileValue = (adjacentCounts[nx * rowNibbleBytes + (ny >> 1)] >> ((ny & 1) << 2)) & 15
+      moveDelta.append((nx, ny, CONST_PLAYER_SYMBOLS[tileValue - CONST_TILE_MINE]))
+      return tileValue
+
+    def isHiddenZero(nx, ny):
+      """Returns whether tile (nx, ny) is a hidden zero tile"""
+      if revealedBits[nx * rowBytes + (ny >> 3)] & (1 << (ny & 7)):
+        return False
+      return not (adjacentCounts[nx * rowNibbleBytes + (ny >> 1)] >> ((ny & 1) << 2)) & 15
+
+    runs = [(x, y, y)]
+    while runs:
+      runX, left, right = runs.pop()
+      # Extend the run along its row over hidden zero tiles
+      while left > 0 and isHiddenZero(runX, left - 1):
+        left -= 1
+        revealIfHidden(runX, left)
+      while right < yDimension - 1 and isHiddenZero(runX, right + 1):
+        right += 1
+        revealIfHidden(runX, right)
+      # Reveal every hidden tile bordering the run; hidden zero tiles
+      # found along the way start new runs
+      firstColumn = max(left - 1, 0)
+      lastColumn = min(right + 2, yDimension)
+      for nx in range(max(runX - 1, 0), min(runX + 2, self.xDimension)):
+        runStart = -1
+        for ny in range(firstColumn, lastColumn):
+          if revealIfHidden(nx, ny) == 0:
+            if runStart < 0:
+              runStart = ny
+            continue
+          if runStart >= 0:
+            runs.append((nx, runStart, ny - 1))
+            runStart = -1
+        if runStart >= 0:
+          runs.append((nx, runStart, lastColumn - 1))
+
+  def makeMove(self, x, y):
+    """A public function called by the user when they have selected their tile.
+
+    This function behaves like MineSweeperBoard.makeMove(). The game
+    is won once the number of revealed tiles equals the number of tiles
+    that do not contain a mine. That number is kept up to date by
+    popcounting only the bytes the move changed, before and after.
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the tile selected
+    y : int
+      y coordinate of the tile selected
+
+    Returns
+    -------
+    list
+      The (x, y, value) tuples of every tile revealed by the move
+    """
+    # Sanitize the user input coordinates
+    if not self.__coordinateCheck(x, y):
+      raise ValueError('invalid coordinate pair chosen')
+    # Check if the move has already been made
+    if self.__hasBit(self.revealedBits, x, y):
+      raise ValueError('move has already been played')
+    if self.__hasBit(self.flagBits, x, y):
+      raise ValueError('tile has been flagged')
+    moveDelta = []
+    # Check if the player has hit a mine
+    if self.__hasBit(self.mineBits, x, y):
+      self.__revealMines(moveDelta)
+      self.gameOver = True
+      self.renderer.renderMessage('player has hit a mine!')
+      return moveDelta
+    tileValue = self.__getTileValue(x, y)
+    touchedBytes = {x * self.rowBytes + (y >> 3): int(self.revealedBits[x, y >> 3])}
+    self.revealedBits[x, y >> 3] |= 1 << (y & 7)
+    moveDelta.append((x, y, CONST_PLAYER_SYMBOLS[tileValue - CONST_TILE_MINE]))
+    # If a player selects a tile with a zero value, uncover all
+    # adjacent tiles
+    if tileValue == 0:
+      self.__uncoverAdjTiles(x, y, moveDelta, touchedBytes)
+    revealedBits = self.revealedBits.reshape(-1)
+    for byteIndex, oldValue in touchedBytes.items():
+      self.numberRevealed += int(CONST_POPCOUNT_TABLE[revealedBits[byteIndex]]) - int(CONST_POPCOUNT_TABLE[oldValue])
+    # If every tile without a mine has been revealed, the player has won
+    if self.numberRevealed == self.xDimension * self.yDimension - self.numberMines:
+      self.gameOver = True
+      self.renderer.renderMessage('player has won!')
+    return moveDelta
+
+  def makeMoves(self, moves):
+    """Plays several tiles in a single call
+
+    This function behaves like MineSweeperBoard.makeMoves(): the moves
+    are played in order until the game is over, skipping tiles that
+    have been revealed or flagged.
+
+    Parameters
+    ----------
+    moves : list
+      The (x, y) coordinates of the tiles to play
+
+    Returns
+    -------
+    list
+      The merged move delta of every tile revealed by the moves
+    """
+    # Sanitize every move before the board is changed
+    for x, y in moves:
+      if not self.__coordinateCheck(x, y):
+        raise ValueError('invalid coordinate pair chosen')
+    moveDelta = []
+    for x, y in moves:
+      if self.gameOver:
+        break
+      if not self.__hasBit(self.revealedBits, x, y) and not self.__hasBit(self.flagBits, x, y):
+        moveDelta.extend(self.makeMove(x, y))
+    return moveDelta
+
+  def getPlayerBoard(self):
+    """Returns the 2D playerViewBoard
+
+    The board is decoded into a list of lists using the same symbols
+    as MineSweeperBoard.getPlayerBoard().
+    """
+    return CONST_PLAYER_SYMBOLS[self.__getPlayerCodes(0, self.xDimension) - CONST_TILE_MINE].tolist()
@@ -0,0 +1,98 @@
+# Import necessary Python libraries
+import numpy as np
+from MineSweeperBoard import MineSweeperBoard, CONST_TILE_MINE, CONST_TILE_UNKNOWN, sampleMineIndices, dilateTiles
+from MineSweeperPlayer import MineSweeperPlayer
+from MineSweeperRenderer import MineSweeperRenderer
+
+CONST_GENERATOR_MAX_REPAIRS = 50
+
+def playWithoutGuessing(board, firstMove):
+  """Plays a board with the AI player until it would have to guess
+
+  The player's solvers run without a time limit, so whether a board is
+  accepted depends only on the board and never on the machine's speed.
+
+  Parameters
+  ----------
+  board : MineSweeperBoard
+    The unplayed board to play
+  firstMove : tuple
+    The (x, y) coordinates of the first tile to open
+
+  Returns
+  -------
+  bool
+    True if the player cleared the board without guessing
+  """
+  player = MineSweeperPlayer(board.xDimension, board.yDimension, board.numberMines, MineSweeperRenderer(), allowGuessing=False, solverTimeLimit=None)
+  player.updatePlayerViewBoard(board.getPlayerBoard())
+  nextMove = firstMove
+  while nextMove is not None and not board.isGameOver():
+    player.applyMoveDelta(board.makeMove(*nextMove))
+    if not board.isGameOver():
+      nextMove = player.makeMove()
+  return board.movesRemaining == 0
+
+def generateNoGuessBoard(xDimension, yDimension, numberMines, seed=None, firstMove=None, maxRepairs=CONST_GENERATOR_MAX_REPAIRS):
+  """Generates a board the AI player can clear without ever guessing
+
+  The tiles around the first move are kept free of mines so that it
+  opens a region. The board is then played by a MineSweeperPlayer that
+  is not allowed to guess. Whenever the player gets stuck, the board is
+  repaired using its feedback: a mine bordering the revealed region is
+  moved to a hidden tile away from it, which changes the numbers the
+  player got stuck on, and the board is played again. If the board
+  cannot be repaired (or too many repairs were needed) a fresh random
+  layout is drawn.
+
+  Parameters
+  ----------
+  xDimension : int
+    The number of rows the gameboard possesses
+  yDimension : int
+    The number of columns the gameboard possesses
+  numberMines : int
+    The number of mines that the board contains
+  seed : int or numpy.random.Generator, optional
+    The seed (or random number generator) used to place and move the
+    mines. The same seed always yields the same board
+  firstMove : tuple, optional
+    The (x, y) coordinates of the first tile the player opens (default
+    is the center of the board)
+  maxRepairs : int, optional
+    The number of repairs attempted before starting from a new layout
+
+  Returns
+  -------
+  MineSweeperBoard
+    An unplayed board that can be cleared from firstMove without guessing
+  tuple
+    The (x, y) coordinates of the first move
+  """
+  rng = np.random.default_rng(seed)
+  if firstMove is None:
+    firstMove = (xDimension // 2, yDimension // 2)
+  firstX, firstY = firstMove
+  # The first move and the tiles around it never hold a mine
+  openingTiles = set(x * yDimension + y for x in range(max(firstX - 1, 0), min(firstX + 2, xDimension)) for y in range(max(firstY - 1, 0), min(firstY + 2, yDimension)))
+  freeTiles = [tile for tile in range(xDimension * yDimension) if tile not in openingTiles]
+  if numberMines > len(freeTiles) or numberMines < 0:
+    raise ValueError('invalid number of mines entered')
+
+  while True:
+    mineIndices = [freeTiles[index] for index in sampleMineIndices(rng, len(freeTiles), numberMines)]
+    for repair in range(maxRepairs + 1):
+      board = MineSweeperBoard(xDimension, yDimension, numberMines, renderer=MineSweeperRenderer(), mineIndices=mineIndices)
+      if playWithoutGuessing(board, firstMove):
+        return MineSweeperBoard(xDimension, yDimension, numberMines, renderer=MineSweeperRenderer(), mineIndices=mineIndices), firstMove
+      # Hidden tiles next to the revealed region are where the player got
+      # stuck; hidden tiles away from it have not influenced the player yet
+      revealed = board.playerViewBoard != CONST_TILE_UNKNOWN
+      mines = board.gameStateBoard == CONST_TILE_MINE
+      touching = dilateTiles(revealed) & ~revealed
+      stuckMines = np.flatnonzero(touching & mines)
+      freeInterior = np.flatnonzero(~dilateTiles(revealed) & ~mines)
+      if board.isGameOver() or len(stuckMines) == 0 or len(freeInterior) == 0:
+        break
+      mineIndices = list(mineIndices)
+      mineIndices[mineIndices.index(int(rng.choice(stuckMines)))] = int(rng.choice(freeInterior))
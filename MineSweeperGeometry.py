@@ -0,0 +1,82 @@
+# Import necessary Python libraries
+from functools import lru_cache
+import numpy as np
+
+# Directions of the eight neighbors of a tile, in the order the original
+# lookups visited them: W, NW, N, NE, E, SE, S, SW
+CONST_NEIGHBOR_DIRECTIONS = [(0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1)]
+
+# Number of board geometries whose neighbor tables are kept
+CONST_GEOMETRY_TABLE_CACHE_SIZE = 4
+
+def getNeighborArray(xDimension, yDimension, degree=1):
+  """Returns the padded neighbor index array of a board geometry
+
+  Tiles are addressed by their flat index (x * yDimension + y). Row i
+  of the array holds the flat indices of the eight tiles found at a
+  distance of degree from tile i along each of the eight compass
+  directions, or -1 where that tile is off the board. Degree 1 gives
+  the adjacent tiles and degree 2 the outer ring used to detect
+  islands of unknown tiles.
+
+  Parameters
+  ----------
+  xDimension : int
+    The number of rows of the board
+  yDimension : int
+    The number of columns of the board
+  degree : int, optional
+    The distance of the neighbors from each tile
+
+  Returns
+  -------
+  numpy.ndarray
+    int32 array of shape (xDimension * yDimension, 8)
+  """
+  xCoordinates, yCoordinates = np.divmod(np.arange(xDimension * yDimension), yDimension)
+  neighbors = np.full((xDimension * yDimension, len(CONST_NEIGHBOR_DIRECTIONS)), -1, dtype=np.int32)
+  for direction, (dx, dy) in enumerate(CONST_NEIGHBOR_DIRECTIONS):
+    nx = xCoordinates + dx * degree
+    ny = yCoordinates + dy * degree
+    valid = (nx >= 0) & (nx < xDimension) & (ny >= 0) & (ny < yDimension)
+    neighbors[valid, direction] = nx[valid] * yDimension + ny[valid]
+  return neighbors
+
+@lru_cache(maxsize=CONST_GEOMETRY_TABLE_CACHE_SIZE)
+def getNeighborTable(xDimension, yDimension, degree=1):
+  """Returns the compact neighbor table of a board geometry
+
+  This is getNeighborArray() with the off-board entries dropped, stored
+  in compressed sparse row form: the neighbors of tile i are
+  indices[offsets[i]:offsets[i + 1]], in the order of
+  CONST_NEIGHBOR_DIRECTIONS. Walking the neighbors of a tile is then a
+  slice of the table with no bounds checks, at about four bytes per
+  neighbor.
+
+  The tables of the last few geometries used are shared by every
+  player of that size, so they are marked read-only.
+
+  Parameters
+  ----------
+  xDimension : int
+    The number of rows of the board
+  yDimension : int
+    The number of columns of the board
+  degree : int, optional
+    The distance of the neighbors from each tile
+
+  Returns
+  -------
+  numpy.ndarray
+    int32 array of xDimension * yDimension + 1 offsets into indices
+  numpy.ndarray
+    int32 array of the flat indices of the neighbors of every tile
+  """
+  neighbors = getNeighborArray(xDimension, yDimension, degree)
+  onBoard = neighbors >= 0
+  offsets = np.zeros(xDimension * yDimension + 1, dtype=np.int32)
+  offsets[1:] = np.cumsum(onBoard.sum(axis=1))
+  indices = neighbors[onBoard]
+  offsets.setflags(write=False)
+  indices.setflags(write=False)
+  return offsets, indices
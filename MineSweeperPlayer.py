@@ -1,10 +1,24 @@
 # Load necessary Python modules
+import time
+from collections import Counter
 from random import randint
-from constraint import *
+from MineSweeperRenderer import IncrementalRenderer
+from MineSweeperGeometry import getNeighborTable
+from MineSweeperProbability import computeMineProbabilities
+from MineSweeperAlgebra import solveLinearConstraints
+from MineSweeperRules import solveSubsetConstraints
+from MineSweeperSolver import createSolver, CachingSolver, CONST_SOLVER_BACKEND_CONSTRAINT, CONST_SOLVER_CACHE_SIZE
+
+# Symbols that a tile of the player's view can hold, other than 'x'
+CONST_PLAYER_CATEGORIES = ['@', '*', '-', 1, 2, 3, 4, 5, 6, 7, 8]
+
+# Number of seconds the solvers may spend deducing a move, and again
+# choosing a guess, before they give up on the remaining constraints
+CONST_PLAYER_SOLVER_SECONDS = 5.0
 
 class MineSweeperPlayer:
 
-  def __init__(self, xDimension, yDimension, numberMines):
+  def __init__(self, xDimension, yDimension, numberMines, renderer=None, allowGuessing=True, solverTimeLimit=CONST_PLAYER_SOLVER_SECONDS, solverBackend=CONST_SOLVER_BACKEND_CONSTRAINT, solverCacheSize=CONST_SOLVER_CACHE_SIZE):
     """Initializes the AI Minesweeper player
 
     Parameters
@@ -17,19 +31,84 @@ class MineSweeperPlayer:
       The number of mines that the board contains. The 
       number should be positive, but less than the total
       number tiles the board has
+    renderer : MineSweeperRenderer, optional
+      The renderer that the player's mind map and status messages
+      are reported to (default is an IncrementalRenderer writing to
+      standard output)
+    allowGuessing : bool, optional
+      If false, makeMove() returns None instead of guessing when the
+      solvers cannot deduce a safe tile
+    solverTimeLimit : float, optional
+      The number of seconds the solvers may spend on a move before
+      they stop searching; None lets them run without limit
+    solverBackend : int, optional
+      The CONST_SOLVER_BACKEND_* backend that counts the solutions of
+      the constraints (default is the constraint.Problem solver)
+    solverCacheSize : int, optional
+      The number of constraint sets whose solutions are remembered
+      from move to move; 0 or None turns the cache off
     """
     self.xDimension = xDimension
     self.yDimension = yDimension
     self.numberMines = numberMines
+    self.renderer = renderer if renderer is not None else IncrementalRenderer()
+    self.allowGuessing = allowGuessing
+    self.solverTimeLimit = solverTimeLimit
+    self.solverDeadline = None
+    self.solver = createSolver(solverBackend)
+    if solverCacheSize:
+      self.solver = CachingSolver(self.solver, solverCacheSize)
+
+    # Compact neighbor tables of the board geometry, shared by every
+    # player of that size: the tiles adjacent to tile i are
+    # neighborIndices[neighborOffsets[i]:neighborOffsets[i + 1]], and
+    # the ring two tables hold the tiles two steps away along each
+    # compass direction. They are read through memoryviews so that
+    # walking a tile's neighbors yields plain ints
+    neighborOffsets, neighborIndices = getNeighborTable(self.xDimension, self.yDimension)
+    ringTwoOffsets, ringTwoIndices = getNeighborTable(self.xDimension, self.yDimension, 2)
+    self.neighborOffsets = memoryview(neighborOffsets)
+    self.neighborIndices = memoryview(neighborIndices)
+    self.ringTwoOffsets = memoryview(ringTwoOffsets)
+    self.ringTwoIndices = memoryview(ringTwoIndices)
 
-    # Player gameboard view consists of the following symbols
+    # Player gameboard view is a flat list, indexed by x * yDimension + y,
+    # consisting of the following symbols
     # -   @ = Unknown (not yet selected) tile
     # -   * = Mine location
     # -   - = 0 value (no adjacent mines)
     # - 1-8 = Number of adjacent mines
-    self.playerBoard = None
+    self.playerTiles = None
+    # Flat indices of the tiles the solvers have found to be safe
     self.moveQueue = []
 
+    # Frontier of the board: the flat indices of the revealed number
+    # tiles that still have unknown neighbors. It is updated whenever a
+    # tile changes, so the solvers never have to scan the whole board
+    self.frontier = set()
+
+    # Cached neighborhood summaries: for a tile index, the counts of each
+    # symbol among its adjacent tiles and among its ring two tiles. An
+    # entry is dropped whenever a tile in either ring changes
+    self.neighborSummaries = {}
+
+    # Unknown tiles of the view, kept as a list together with the
+    # position of each tile in it, so that tiles are removed and drawn
+    # at random in constant time. Along with the number of marked
+    # mines, it is updated from the tiles that change, so guessing
+    # never has to scan the whole board
+    self.unknownTiles = []
+    self.unknownPositions = {}
+    self.numberMarkedMines = 0
+
+  @property
+  def playerBoard(self):
+    """The player's view of the gameboard as a 2D list, or None if unseen
+    """
+    if self.playerTiles is None:
+      return None
+    return [self.playerTiles[x * self.yDimension:(x + 1) * self.yDimension] for x in range(self.xDimension)]
+
   def print(self, gameboard=None):
     """Print the player's mind gameboard
 
@@ -65,310 +144,580 @@ class MineSweeperPlayer:
       The 2D array that describes the board state. This is returned by
       the board class after the player makes a move 
     """
-    if self.playerBoard == None:
-      self.playerBoard = [row[:] for row in playerBoard]
+    if self.playerTiles is None:
+      self.playerTiles = [value for row in playerBoard for value in row]
+      self.frontier = set()
+      self.neighborSummaries = {}
+      self.__resetUnknownTiles()
+      self.__updateFrontier(range(len(self.playerTiles)))
     else:
-      for x, row in enumerate(playerBoard):
-        for y, value in enumerate(row):
-          if self.playerBoard[x][y] != '*':
-            self.playerBoard[x][y] = playerBoard[x][y]
+      changedTiles = []
+      for index, value in enumerate(value for row in playerBoard for value in row):
+        if self.playerTiles[index] != '*' and self.playerTiles[index] != value:
+          self.playerTiles[index] = value
+          changedTiles.append(index)
+      self.__tilesChanged(changedTiles)
 
-  def __coordinateCheck(self, x, y):
-    """Checks to make sure that the coordinate pair is within bounds of the board
+  def applyMoveDelta(self, moveDelta):
+    """Updates the player's mental board state with the tiles revealed by a move
 
-    This is a helper function that checks to ensure that the input coordinates
-    are within the dimensions of the board.
+    This function applies the move delta returned by
+    MineSweeperBoard.makeMove() to the player's own tracking of the
+    gameboard. Only the revealed tiles are visited, so the cost of
+    staying in sync scales with the size of the delta rather than
+    the size of the board.
 
     Parameters
     ----------
-    x : int
-      x coordinate of the coordinate pair to check
-    y : int
-      y coordinate of the coordinate pair to check
+    moveDelta : list
+      The (x, y, value) tuples of the tiles revealed by the last move
     """
-    if x < 0 or x >= self.xDimension:
-      return False
-    if y < 0 or y >= self.yDimension:
-      return False
-    return True
-  
+    if self.playerTiles is None:
+      self.playerTiles = ['@'] * (self.xDimension * self.yDimension)
+      self.__resetUnknownTiles()
+    changedTiles = []
+    for x, y, value in moveDelta:
+      index = x * self.yDimension + y
+      if self.playerTiles[index] != '*':
+        self.playerTiles[index] = value
+        changedTiles.append(index)
+    self.__tilesChanged(changedTiles)
+
+  def __resetUnknownTiles(self):
+    """Rebuilds the unknown tiles and marked mine count from the whole view
+    """
+    self.unknownTiles = [index for index, value in enumerate(self.playerTiles) if value == '@']
+    self.unknownPositions = {index: position for position, index in enumerate(self.unknownTiles)}
+    self.numberMarkedMines = self.playerTiles.count('*')
+
+  def __tilesChanged(self, tiles):
+    """Updates the frontier, summaries and unknown tiles after tiles of the view changed
+
+    Parameters
+    ----------
+    tiles : list
+      The flat indices of the tiles that changed
+    """
+    neighborOffsets, neighborIndices = self.neighborOffsets, self.neighborIndices
+    ringTwoOffsets, ringTwoIndices = self.ringTwoOffsets, self.ringTwoIndices
+    unknownTiles, unknownPositions = self.unknownTiles, self.unknownPositions
+    affectedTiles = set(tiles)
+    for index in tiles:
+      if self.playerTiles[index] == '@':
+        if index not in unknownPositions:
+          unknownPositions[index] = len(unknownTiles)
+          unknownTiles.append(index)
+      elif index in unknownPositions:
+        # Swap the last unknown tile into the removed tile's position
+        lastTile = unknownTiles.pop()
+        position = unknownPositions.pop(index)
+        if lastTile != index:
+          unknownTiles[position] = lastTile
+          unknownPositions[lastTile] = position
+      affectedTiles.update(neighborIndices[neighborOffsets[index]:neighborOffsets[index + 1]])
+      for neighbor in ringTwoIndices[ringTwoOffsets[index]:ringTwoOffsets[index + 1]]:
+        self.neighborSummaries.pop(neighbor, None)
+    for index in affectedTiles:
+      self.neighborSummaries.pop(index, None)
+    self.__updateFrontier(affectedTiles)
+
+  def __getNeighborSummary(self, index):
+    """Returns the symbol counts around a tile, computing them if needed
+
+    Both rings are summarized in a single pass over the neighbor tables.
+
+    Parameters
+    ----------
+    index : int
+      The flat index of the tile
+
+    Returns
+    -------
+    Counter
+      The number of adjacent tiles holding each symbol
+    Counter
+      The number of ring two tiles holding each symbol
+    """
+    summary = self.neighborSummaries.get(index)
+    if summary is None:
+      playerTiles = self.playerTiles
+      ringOne = self.neighborIndices[self.neighborOffsets[index]:self.neighborOffsets[index + 1]]
+      ringTwo = self.ringTwoIndices[self.ringTwoOffsets[index]:self.ringTwoOffsets[index + 1]]
+      summary = (Counter([playerTiles[neighbor] for neighbor in ringOne]), Counter([playerTiles[neighbor] for neighbor in ringTwo]))
+      self.neighborSummaries[index] = summary
+    return summary
+
+  def __updateFrontier(self, tiles):
+    """Recomputes the frontier membership of the given tiles
+
+    A tile belongs to the frontier when it holds a revealed number and
+    at least one of its neighbors is unknown.
+
+    Parameters
+    ----------
+    tiles : iterable
+      The flat indices of the tiles whose membership may have changed
+    """
+    playerTiles = self.playerTiles
+    neighborOffsets, neighborIndices = self.neighborOffsets, self.neighborIndices
+    for index in tiles:
+      if type(playerTiles[index]) is int and any(playerTiles[neighbor] == '@' for neighbor in neighborIndices[neighborOffsets[index]:neighborOffsets[index + 1]]):
+        self.frontier.add(index)
+      else:
+        self.frontier.discard(index)
+
+  def __markMine(self, index):
+    """Marks a tile as a mine in the player's view
+
+    Parameters
+    ----------
+    index : int
+      The flat index of the mine
+    """
+    if self.playerTiles[index] != '*':
+      self.numberMarkedMines += 1
+    self.playerTiles[index] = '*'
+    self.__tilesChanged([index])
+
   def __chooseRandomMove(self):
     """Chooses a random, valid move to make
 
     In the event that the current board does not produce a
     consistent answer when solving the satisfiability problems,
     a random, valid move is chosen instead. This move is added
-    to the player move queue
+    to the player move queue, unless no unknown tile is left
     """
-    randXCoordinate = randint(0, self.xDimension - 1)
-    randYCoordinate = randint(0, self.yDimension - 1)
-    if self.playerBoard[randXCoordinate][randYCoordinate] == '@':
-      self.moveQueue.append((randXCoordinate, randYCoordinate))
-      return True
-    else:
-      return self.__chooseRandomMove()
+    if len(self.unknownTiles) == 0:
+      return False
+    self.moveQueue.append(self.unknownTiles[randint(0, len(self.unknownTiles) - 1)])
+    return True
+
+  def __chooseInteriorTile(self, frontierVariables):
+    """Chooses a random unknown tile that no constraint touches
 
-  def __twoDegreeIsland(self, x, y):
+    While most unknown tiles are interior tiles, they are drawn from
+    the unknown tiles until one lies outside the frontier. Otherwise,
+    the interior tiles are listed by walking the unknown tiles, of
+    which there are then at most twice as many as frontier variables.
+
+    Parameters
+    ----------
+    frontierVariables : set
+      The flat indices of the unknown tiles constrained by the frontier
+
+    Returns
+    -------
+    int
+      The flat index of the chosen tile
+    """
+    unknownTiles = self.unknownTiles
+    if 2 * len(frontierVariables) <= len(unknownTiles):
+      while True:
+        index = unknownTiles[randint(0, len(unknownTiles) - 1)]
+        if index not in frontierVariables:
+          return index
+    interiorTiles = [index for index in unknownTiles if index not in frontierVariables]
+    return interiorTiles[randint(0, len(interiorTiles) - 1)]
+
+  def __twoDegreeIsland(self, index):
     """Determines if a tile is a two degree island
 
     This function determines if a specified tile is surrounded
-    by two degrees of empty tiles.
+    by two degrees of empty tiles. The counts come from the cached
+    neighborhood summary of the tile.
 
     Parameters
     ----------
-    x : int
-      x coordinate of the coordinate pair to check
-    y : int
-      y coordinate of the coordinate pair to check
+    index : int
+      The flat index of the tile to check
     """
-    numAdjMines, _ = self.__getNumberAdj(x, y, '*')
-    numAdjUnknown, _ = self.__getNumberAdj(x, y, '@')
-    numAdj0, _ = self.__getNumberAdj(x, y, '-')
-    numAdj1, _ = self.__getNumberAdj(x, y, 1)
-    numAdj2, _ = self.__getNumberAdj(x, y, 2)
-    numAdj3, _ = self.__getNumberAdj(x, y, 3)
-    numAdj4, _ = self.__getNumberAdj(x, y, 4)
-    numAdj5, _ = self.__getNumberAdj(x, y, 5)
-    numAdj6, _ = self.__getNumberAdj(x, y, 6)
-    numAdj7, _ = self.__getNumberAdj(x, y, 7)
-    numAdj8, _ = self.__getNumberAdj(x, y, 8)
-    if (float(numAdjUnknown) / (numAdj0 + numAdj1 + numAdj2 + numAdj3 + numAdj4 + numAdj5 + numAdj6 + numAdj7 + numAdj8 + numAdjMines + numAdjUnknown) == 1):
-      numAdjMines2, _ = self.__getNumberAdj(x, y, '*', 2)
-      numAdjUnknown2, _ = self.__getNumberAdj(x, y, '@', 2)
-      numAdj02, _ = self.__getNumberAdj(x, y, '-', 2)
-      numAdj12, _ = self.__getNumberAdj(x, y, 1, 2)
-      numAdj22, _ = self.__getNumberAdj(x, y, 2, 2)
-      numAdj32, _ = self.__getNumberAdj(x, y, 3, 2)
-      numAdj42, _ = self.__getNumberAdj(x, y, 4, 2)
-      numAdj52, _ = self.__getNumberAdj(x, y, 5, 2)
-      numAdj62, _ = self.__getNumberAdj(x, y, 6, 2)
-      numAdj72, _ = self.__getNumberAdj(x, y, 7, 2)
-      numAdj82, _ = self.__getNumberAdj(x, y, 8, 2)
-      return (float(numAdjUnknown2) / (numAdj02 + numAdj12 + numAdj22 + numAdj32 + numAdj42 + numAdj52 + numAdj62 + numAdj72 + numAdj82 + numAdjMines2 + numAdjUnknown2) == 1)
-    else:
-      return False
+    ringOneCounts, ringTwoCounts = self.__getNeighborSummary(index)
+    for counts in (ringOneCounts, ringTwoCounts):
+      numAdjTiles = sum(counts[category] for category in CONST_PLAYER_CATEGORIES)
+      if numAdjTiles == 0 or counts['@'] != numAdjTiles:
+        return False
+    return True
 
-  def __formulateConstraintEq(self, x, y):
-    """Creates a constaint equation for the tile located at (x,y)
+  def __formulateConstraintEq(self, index, includeIslands=False):
+    """Creates a constaint equation for a tile
+
+    The variables of the equation are the flat indices of the unknown
+    tiles around it, so the solvers never build or parse coordinate
+    strings.
 
     Parameters
     ----------
-    x : int
-      x coordinate of the coordinate pair to check
-    y : int
-      y coordinate of the coordinate pair to check
+    index : int
+      The flat index (x * yDimension + y) of the tile
+    includeIslands : bool, optional
+      If true, tiles that are two degree islands also get an equation
     """
-    if self.playerBoard[x][y] == '@' or self.playerBoard[x][y] == '-' or self.playerBoard[x][y] == '*':
+    tileValue = self.playerTiles[index]
+    if tileValue == '@' or tileValue == '-' or tileValue == '*':
       return None
-    tileValue = self.playerBoard[x][y]
-    variablesList = []
-    mOccurrences, mCoordinates = self.__getNumberAdj(x, y, '*')
-    fOccurrences, fCoordinates = self.__getNumberAdj(x, y, '@')
-    if fOccurrences == 0:
+    ringOneCounts, _ = self.__getNeighborSummary(index)
+    if ringOneCounts['@'] == 0:
       return None
-    if self.__twoDegreeIsland(x, y):
+    if not includeIslands and self.__twoDegreeIsland(index):
       return None
-    tileValue -= mOccurrences
-    for fCoordinate in fCoordinates:
-      variablesList.append(','.join(map(str, fCoordinate)))
-    return ( (x,y), tileValue, variablesList )
+    fOccurrences, variablesList = self.__getNumberAdj(index, '@')
+    tileValue -= ringOneCounts['*']
+    return ( index, tileValue, variablesList )
 
-  def __getAllConstraints(self):
+  def __getAllConstraints(self, includeIslands=False):
     """Generates a list of constraints for all fringe tiles on the board with adjacent empty spaces
+
+    Only the frontier is visited; the tiles are taken in row-major order.
+
+    Parameters
+    ----------
+    includeIslands : bool, optional
+      If true, tiles that are two degree islands are not skipped
     """
     constraintList = []
-    for x, row in enumerate(self.playerBoard):
-      for y, value in enumerate(row):
-        constraintEq = self.__formulateConstraintEq(x, y)
-        if constraintEq != None:
-          constraintList.append(constraintEq)
+    for index in sorted(self.frontier):
+      constraintEq = self.__formulateConstraintEq(index, includeIslands)
+      if constraintEq != None:
+        constraintList.append(constraintEq)
     return constraintList
 
-  def __getNumberAdj(self, x, y, character, degree=1):
-    """
+  def __getNumberAdj(self, index, character, degree=1):
+    """Finds the tiles around a tile that hold a given symbol
+
+    The tiles are sliced out of the shared neighbor tables, so no
+    bounds checks are needed.
+
+    Parameters
+    ----------
+    index : int
+      The flat index of the tile to search around
+    character : str or int
+      The symbol to look for
+    degree : int, optional
+      1 to search the adjacent tiles, 2 to search the tiles two steps
+      away along each compass direction
+
+    Returns
+    -------
+    int
+      The number of tiles holding the symbol
+    list
+      The flat indices of those tiles
     """
-    totalOccurrences = 0
-    occurrenceCoordinates = []
-    if (self.__coordinateCheck(x, y-degree)):
-      if self.playerBoard[x][y-degree] == character:
-        totalOccurrences += 1
-        occurrenceCoordinates.append( (x,y-degree) )
-    ## Check the tile to the north-west
-    if (self.__coordinateCheck(x-degree, y-degree)):
-      if self.playerBoard[x-degree][y-degree] == character:
-        totalOccurrences += 1
-        occurrenceCoordinates.append( (x-degree,y-degree) )
-    ## Check the tile to the north
-    if (self.__coordinateCheck(x-degree, y)):
-      if self.playerBoard[x-degree][y] == character:
-        totalOccurrences += 1
-        occurrenceCoordinates.append( (x-degree,y) )
-    ## Check the tile to the north-east
-    if (self.__coordinateCheck(x-degree, y+degree)):
-      if self.playerBoard[x-degree][y+degree] == character:
-        totalOccurrences += 1
-        occurrenceCoordinates.append( (x-degree,y+degree) )
-    ## Check the tile to the east
-    if (self.__coordinateCheck(x, y+degree)):
-      if self.playerBoard[x][y+degree] == character:
-        totalOccurrences += 1
-        occurrenceCoordinates.append( (x,y+degree) )
-    ## Check the tile to the south-east
-    if (self.__coordinateCheck(x+degree, y+degree)):
-      if self.playerBoard[x+degree][y+degree] == character:
-        totalOccurrences += 1
-        occurrenceCoordinates.append( (x+degree,y+degree) )
-    ## Check the tile to the south
-    if (self.__coordinateCheck(x+degree, y)):
-      if self.playerBoard[x+degree][y] == character:
-        totalOccurrences += 1
-        occurrenceCoordinates.append( (x+degree,y) )
-    ## Check the tile to the south-west
-    if (self.__coordinateCheck(x+degree, y-degree)):
-      if self.playerBoard[x+degree][y-degree] == character:
-        totalOccurrences += 1
-        occurrenceCoordinates.append( (x+degree,y-degree) )
-    return totalOccurrences, occurrenceCoordinates
+    playerTiles = self.playerTiles
+    if degree == 1:
+      offsets, indices = self.neighborOffsets, self.neighborIndices
+    else:
+      offsets, indices = self.ringTwoOffsets, self.ringTwoIndices
+    occurrenceIndices = [neighbor for neighbor in indices[offsets[index]:offsets[index + 1]] if playerTiles[neighbor] == character]
+    return len(occurrenceIndices), occurrenceIndices
 
   def __firstDegreeSolver(self):
     wasUsed = False
-    for x, row in enumerate(self.playerBoard):
-      for y, value in enumerate(row):
-        if value != '@' and value != '-' and value != '*':
-          mOccurrences, mCoordinates = self.__getNumberAdj(x, y, '*')
-          fOccurrences, fCoordinates = self.__getNumberAdj(x, y, '@')
-          if value - mOccurrences == 0:
-            # Rest must be OK spaces
-            for fCoordinate in fCoordinates:
-              self.moveQueue.append(fCoordinate)
-              wasUsed = True
-          elif value - mOccurrences == fOccurrences:
-            # Rest must be mines
-            for fCoordinate in fCoordinates:
-              fCX = fCoordinate[0]
-              fCY = fCoordinate[1]
-              self.playerBoard[fCX][fCY] = '*'
-              wasUsed = True
+    for index in sorted(self.frontier):
+      value = self.playerTiles[index]
+      ringOneCounts, _ = self.__getNeighborSummary(index)
+      mOccurrences = ringOneCounts['*']
+      fOccurrences = ringOneCounts['@']
+      if value - mOccurrences != 0 and value - mOccurrences != fOccurrences:
+        continue
+      fOccurrences, fIndices = self.__getNumberAdj(index, '@')
+      if value - mOccurrences == 0:
+        # Rest must be OK spaces
+        for fIndex in fIndices:
+          self.moveQueue.append(fIndex)
+          wasUsed = True
+      elif value - mOccurrences == fOccurrences:
+        # Rest must be mines
+        for fIndex in fIndices:
+          self.__markMine(fIndex)
+          wasUsed = True
     return wasUsed
 
-  def __secondDegreeSolver(self):
+  def __subsetSolver(self):
+    """Deduces tiles from constraints whose tiles contain another's
+
+    See solveSubsetConstraints() for the rule that is applied.
     """
+    return self.__applyForcedValues(solveSubsetConstraints(self.__getAllConstraints(includeIslands=True)))
+
+  def __applyForcedValues(self, forcedValues):
+    """Queues the forced safe tiles and marks the forced mines
+
+    Parameters
+    ----------
+    forcedValues : dict
+      The forced value (0 for safe, 1 for a mine) of each tile index
+
+    Returns
+    -------
+    bool
+      True if any unknown tile was forced
+    """
+    wasUsed = False
+    for variable, value in forcedValues.items():
+      if self.playerTiles[variable] != '@':
+        continue
+      if value == 0:
+        self.moveQueue.append(variable)
+        wasUsed = True
+      if value == 1:
+        self.__markMine(variable)
+        wasUsed = True
+    return wasUsed
+
+  def __linearAlgebraSolver(self):
+    """Deduces tiles from linear combinations of the frontier equations
+
+    The constraint equations of each independent region are row reduced
+    over the rationals, and the reduced rows are read for tiles that
+    can only be 0 or only be 1. This takes polynomial time, so it runs
+    before any of the constraint searches.
+    """
+    wasUsed = False
+    for component in self.__getConstraintComponents(self.__getAllConstraints(includeIslands=True)):
+      if self.__applyForcedValues(solveLinearConstraints(component)):
+        wasUsed = True
+    return wasUsed
+
+  def __getConstraintGraph(self, constraintsList):
+    """Finds which constraints share variables with each other
+
+    Every variable is indexed to the constraints that contain it, and
+    two constraints are connected when they share at least one
+    variable. Constraints that are not connected cannot tell each other
+    anything, so only connected pairs and triples need to be solved.
+
+    Parameters
+    ----------
+    constraintsList : list
+      The constraints returned by __getAllConstraints()
+
+    Returns
+    -------
+    list
+      For every constraint, the set of indices of the constraints
+      connected to it
+    """
+    variableConstraints = {}
+    for constraintIndex, constraint in enumerate(constraintsList):
+      for variable in constraint[2]:
+        variableConstraints.setdefault(variable, []).append(constraintIndex)
+    connectedConstraints = [set() for constraint in constraintsList]
+    for constraintIndices in variableConstraints.values():
+      for constraintIndex in constraintIndices:
+        connectedConstraints[constraintIndex].update(constraintIndices)
+    for constraintIndex, connected in enumerate(connectedConstraints):
+      connected.discard(constraintIndex)
+    return connectedConstraints
+
+  def __countSolutions(self, constraints):
+    """Counts the solutions of a set of constraints
+
+    The counting is done by the player's solver backend. The search
+    stops at the solver deadline of the current move; the counts then
+    only cover the solutions found so far.
+
+    Parameters
+    ----------
+    constraints : list
+      The constraint equations to solve together
+
+    Returns
+    -------
+    list
+      The variables of the constraints
+    dict
+      The number of solutions for each number of mines they place
+    dict
+      For each number of mines, the list of how many of those solutions
+      place a mine on each variable
+    bool
+      False if the search was stopped by the deadline
+    """
+    return self.solver.countSolutions(constraints, self.solverDeadline)
+
+  def __solveConstraints(self, constraints):
+    """Solves a set of constraints and applies the tiles they force
+
+    Every variable that takes the same value in all the solutions is
+    forced: safe tiles are queued as moves and mines are marked.
+    Nothing is forced if the deadline stopped the search, since the
+    missing solutions could disagree.
+
+    Parameters
+    ----------
+    constraints : list
+      The constraint equations to solve together
+
+    Returns
+    -------
+    bool
+      True if any tile was forced
+    """
+    return self.__applyForcedValues(self.solver.solveConstraints(constraints, self.solverDeadline))
+
+  def __secondDegreeSolver(self):
+    """Solves every pair of constraints that share a variable
+
+    Each connected pair is found through the constraint graph and
+    solved exactly once. Pairs where one constraint's tiles contain the
+    other's are left to the subset rule, which has already applied
+    everything they can force.
     """
     wasUsed = False
-    constraintProblem = Problem()
     constraintsList = self.__getAllConstraints()
-    for x in range(0,len(constraintsList) - 1):
-      for y in range(x+1, len(constraintsList)):
-        constraintProblem.reset()
-        constraint1 = constraintsList[x]
-        constraint2 = constraintsList[y]
-        uniqueVariables = list(set(constraint1[2] + constraint2[2]))
-        constraintProblem.addVariables(uniqueVariables, [0,1])
-        constraintProblem.addConstraint(ExactSumConstraint(constraint1[1]), constraint1[2])
-        constraintProblem.addConstraint(ExactSumConstraint(constraint2[1]), constraint2[2])
-        solutions = constraintProblem.getSolutions()
-        if len(solutions) != 0:
-          for variable in uniqueVariables:
-            firstVal = solutions[0][variable]
-            isConsistent = True
-            for solution in solutions:
-              if solution[variable] != firstVal:
-                isConsistent = False
-                break
-            if isConsistent:
-              decodedX = int(variable.split(',')[0])
-              decodedY = int(variable.split(',')[1])
-              if firstVal == 0:
-                self.moveQueue.append((decodedX, decodedY))
-                wasUsed = True
-              if firstVal == 1:
-                self.playerBoard[decodedX][decodedY] = '*'
-                wasUsed = True
+    connectedConstraints = self.__getConstraintGraph(constraintsList)
+    for x in range(len(constraintsList)):
+      for y in sorted(connectedConstraints[x]):
+        if y > x:
+          firstVariables = set(constraintsList[x][2])
+          secondVariables = set(constraintsList[y][2])
+          if firstVariables <= secondVariables or secondVariables <= firstVariables:
+            continue
+          if self.__solveConstraints([constraintsList[x], constraintsList[y]]):
+            wasUsed = True
     return wasUsed
 
   def __thirdDegreeSolver(self):
-    """
+    """Solves every connected triple of constraints
+
+    A triple is connected when one of its constraints (the center)
+    shares variables with the two others. A chain has a single center
+    while all three constraints of a triangle are centers, so a
+    triangle is only solved from its lowest numbered constraint. Each
+    connected triple is therefore solved exactly once.
     """
     wasUsed = False
-    constraintProblem = Problem()
     constraintsList = self.__getAllConstraints()
-    for x in range(0,len(constraintsList) - 2):
-      for y in range(x+1, len(constraintsList) - 1):
-        for z in range(x+2, len(constraintsList)):
-          constraintProblem.reset()
-          constraint1 = constraintsList[x]
-          constraint2 = constraintsList[y]
-          constraint3 = constraintsList[z]
-          uniqueVariables = list(set(constraint1[2] + constraint2[2] + constraint3[2]))
-          constraintProblem.addVariables(uniqueVariables, [0,1])
-          constraintProblem.addConstraint(ExactSumConstraint(constraint1[1]), constraint1[2])
-          constraintProblem.addConstraint(ExactSumConstraint(constraint2[1]), constraint2[2])
-          constraintProblem.addConstraint(ExactSumConstraint(constraint3[1]), constraint3[2])
-          solutions = constraintProblem.getSolutions()
-          if len(solutions) != 0:
-            for variable in uniqueVariables:
-              firstVal = solutions[0][variable]
-              isConsistent = True
-              for solution in solutions:
-                if solution[variable] != firstVal:
-                  isConsistent = False
-                  break
-              if isConsistent:
-                decodedX = int(variable.split(',')[0])
-                decodedY = int(variable.split(',')[1])
-                if firstVal == 0:
-                  self.moveQueue.append((decodedX, decodedY))
-                  wasUsed = True
-                if firstVal == 1:
-                  self.playerBoard[decodedX][decodedY] = '*'
-                  wasUsed = True
+    connectedConstraints = self.__getConstraintGraph(constraintsList)
+    for y in range(len(constraintsList)):
+      neighbors = sorted(connectedConstraints[y])
+      for i, x in enumerate(neighbors):
+        for z in neighbors[i + 1:]:
+          if z in connectedConstraints[x] and y > x:
+            continue
+          if self.__solveConstraints([constraintsList[x], constraintsList[y], constraintsList[z]]):
+            wasUsed = True
     return wasUsed
   
-  def __globalSolver(self):
+  def __getConstraintComponents(self, constraintsList):
+    """Splits the constraints into independent connected components
+
+    Constraints are joined whenever they share a variable, using a
+    union-find over the variables. Constraints in different components
+    have no variable in common, so each component can be solved on its
+    own.
+
+    Parameters
+    ----------
+    constraintsList : list
+      The constraints returned by __getAllConstraints()
+
+    Returns
+    -------
+    list
+      The components, each a list of constraints
     """
+    parents = {}
+
+    def findRoot(variable):
+      """Returns the representative variable of a variable's component"""
+      while parents[variable] != variable:
+        parents[variable] = parents[parents[variable]]
+        variable = parents[variable]
+      return variable
+
+    for constraint in constraintsList:
+      for variable in constraint[2]:
+        parents.setdefault(variable, variable)
+      root = findRoot(constraint[2][0])
+      for variable in constraint[2][1:]:
+        parents[findRoot(variable)] = root
+    components = {}
+    for constraint in constraintsList:
+      components.setdefault(findRoot(constraint[2][0]), []).append(constraint)
+    return list(components.values())
+
+  def __globalSolver(self):
+    """Solves the constraints of every independent region of the board
+
+    The frontier is split into connected components that are solved
+    separately, so the work is the sum of the work for each region
+    instead of the product of their numbers of solutions.
     """
     wasUsed = False
-    constraintProblem = Problem()
-    constraintsList = self.__getAllConstraints()
-    uniqueVariables = []
-    for constraint in constraintsList:
-      uniqueVariables = uniqueVariables + constraint[2]
-      constraintProblem.addConstraint(ExactSumConstraint(constraint[1]), constraint[2])
-    uniqueVariables = list(set(uniqueVariables))
-    constraintProblem.addVariables(uniqueVariables, [0,1])
-    solutions = constraintProblem.getSolutions()
-    if len(solutions) != 0:
-      for variable in uniqueVariables:
-        firstVal = solutions[0][variable]
-        isConsistent = True
-        for solution in solutions:
-          if solution[variable] != firstVal:
-            isConsistent = False
-            break
-        if isConsistent:
-          decodedX = int(variable.split(',')[0])
-          decodedY = int(variable.split(',')[1])
-          if firstVal == 0:
-            self.moveQueue.append((decodedX, decodedY))
-            wasUsed = True
-          if firstVal == 1:
-            self.playerBoard[decodedX][decodedY] = '*'
-            wasUsed = True
+    for component in self.__getConstraintComponents(self.__getAllConstraints()):
+      if self.__solveConstraints(component):
+        wasUsed = True
     return wasUsed
 
+  def __chooseSafestMove(self):
+    """Chooses the unknown tile least likely to hold a mine
+
+    The exact mine probability of every unknown tile is computed from
+    the solution counts of each independent frontier component, weighted
+    by the number of ways to place the remaining mines among the
+    unknown tiles that no constraint touches. The tile with the lowest
+    probability is added to the player move queue. If the constraints
+    cannot be satisfied, a random move is chosen instead.
+
+    The guess gets a time limit of its own. Components whose search is
+    stopped by it are weighed by the solutions found in time, so the
+    probabilities become estimates.
+    """
+    self.__startSolverDeadline()
+    components = []
+    componentVariables = []
+    for component in self.__getConstraintComponents(self.__getAllConstraints(includeIslands=True)):
+      uniqueVariables, solutionCounts, mineCounts, isComplete = self.__countSolutions(component)
+      components.append((solutionCounts, mineCounts))
+      componentVariables.append(uniqueVariables)
+    frontierVariables = set(variable for uniqueVariables in componentVariables for variable in uniqueVariables)
+    # Every frontier variable is an unknown tile
+    numberInteriorTiles = len(self.unknownTiles) - len(frontierVariables)
+    numberMines = self.numberMines - self.numberMarkedMines
+    probabilities, interiorProbability = computeMineProbabilities(components, numberInteriorTiles, numberMines)
+    if probabilities is None:
+      return self.__chooseRandomMove()
+    safestMove = None
+    safestProbability = None
+    for uniqueVariables, variableProbabilities in zip(componentVariables, probabilities):
+      for variable, probability in sorted(zip(uniqueVariables, variableProbabilities)):
+        if safestProbability is None or probability < safestProbability:
+          safestMove, safestProbability = variable, probability
+    if numberInteriorTiles != 0 and (safestProbability is None or interiorProbability < safestProbability):
+      safestMove = self.__chooseInteriorTile(frontierVariables)
+    if safestMove is None:
+      return self.__chooseRandomMove()
+    self.moveQueue.append(safestMove)
+    return True
+
+  def __startSolverDeadline(self):
+    """Starts the time limit for the solvers working on the current move
+    """
+    self.solverDeadline = None if self.solverTimeLimit is None else time.time() + self.solverTimeLimit
+
   def makeMove(self):
     """
     """
     if len(self.moveQueue) != 0:
       nextMove = self.moveQueue.pop()
-      if self.playerBoard[nextMove[0]][nextMove[1]] != '@':
+      if self.playerTiles[nextMove] != '@':
         return self.makeMove()
-      self.print()
-      return nextMove[0], nextMove[1]
+      self.renderer.renderPlayer(self)
+      return divmod(nextMove, self.yDimension)
     else:
+      self.__startSolverDeadline()
       firstResults = self.__firstDegreeSolver()
       if firstResults:
         return self.makeMove()
+      subsetResults = self.__subsetSolver()
+      if subsetResults:
+        return self.makeMove()
+      linearResults = self.__linearAlgebraSolver()
+      if linearResults:
+        return self.makeMove()
       secondResults = self.__secondDegreeSolver()
       if secondResults:
         return self.makeMove()
@@ -378,9 +727,35 @@ class MineSweeperPlayer:
       globalResults = self.__globalSolver()
       if globalResults:
         return self.makeMove()
-      randomResults = self.__chooseRandomMove()
-      if randomResults:
-        print('Not sure what to do... choosing random')
+      if not self.allowGuessing:
+        return None
+      guessResults = self.__chooseSafestMove()
+      if guessResults:
+        self.renderer.renderMessage('Not sure what to do... guessing the safest tile')
         return self.makeMove()
 
-  
\ No newline at end of file
+  def makeMoves(self):
+    """Returns every safe move the player has queued
+
+    The first move is chosen exactly as by makeMove(), which runs the
+    solvers when the queue is empty. Any other hidden tiles left in the
+    queue are returned with it, so that they can be played in a single
+    call to MineSweeperBoard.makeMoves().
+
+    Returns
+    -------
+    list
+      The (x, y) coordinates of the moves to play, which is empty when
+      the player would have to guess but guessing is not allowed
+    """
+    firstMove = self.makeMove()
+    if firstMove is None:
+      return []
+    moves = [firstMove]
+    queued = set([firstMove[0] * self.yDimension + firstMove[1]])
+    while len(self.moveQueue) != 0:
+      nextMove = self.moveQueue.pop()
+      if nextMove not in queued and self.playerTiles[nextMove] == '@':
+        moves.append(divmod(nextMove, self.yDimension))
+        queued.add(nextMove)
+    return moves
@@ -0,0 +1,158 @@
+# Import necessary Python libraries
+from fractions import Fraction
+
+# Number of significant bits kept in the weights of the interior
+# placements. Exact weights run to tens of thousands of bits on the
+# largest boards, and are slow to multiply; rounding them to this many
+# bits moves the probabilities by amounts far too small to change
+# which tile is guessed
+CONST_PROBABILITY_WEIGHT_BITS = 256
+
+def countCombinationWeights(n, kLow, kHigh):
+  """Returns integers proportional to the number of ways to choose k of n tiles
+
+  Computing every binomial exactly is far too slow on large boards, so
+  only their ratios are computed, using C(n, k + 1) = C(n, k) * (n - k)
+  / (k + 1). Scaled by the product of every denominator, entry j is the
+  product of the numerators of the first j steps and the denominators
+  of the others, which prefix and suffix products give in linear time.
+
+  Parameters
+  ----------
+  n : int
+    The number of tiles to choose from
+  kLow : int
+    The smallest number of tiles to choose, with 0 <= kLow <= n
+  kHigh : int
+    The largest number of tiles to choose, with kLow <= kHigh <= n
+
+  Returns
+  -------
+  list
+    For each k from kLow to kHigh, an integer proportional to C(n, k)
+  """
+  numerators = [1]
+  for k in range(kLow, kHigh):
+    numerators.append(numerators[-1] * (n - k))
+  denominators = [1]
+  for k in range(kHigh, kLow, -1):
+    denominators.append(denominators[-1] * k)
+  denominators.reverse()
+  return [numerator * denominator for numerator, denominator in zip(numerators, denominators)]
+
+def convolveCounts(firstCounts, secondCounts):
+  """Combines the solution counts of two independent components
+
+  Parameters
+  ----------
+  firstCounts : dict
+    The number of solutions of the first component for each number of mines
+  secondCounts : dict
+    The number of solutions of the second component for each number of mines
+
+  Returns
+  -------
+  dict
+    The number of joint solutions for each total number of mines
+  """
+  counts = {}
+  for firstMines, firstSolutions in firstCounts.items():
+    for secondMines, secondSolutions in secondCounts.items():
+      counts[firstMines + secondMines] = counts.get(firstMines + secondMines, 0) + firstSolutions * secondSolutions
+  return counts
+
+def computeMineProbabilities(components, numberInteriorTiles, numberMines):
+  """Computes the probability that each unknown tile holds a mine
+
+  The unknown tiles are split into the variables of independent
+  frontier components and the interior tiles that no constraint
+  touches. Every board consistent with the constraints is equally
+  likely, so a joint solution of the components that places K mines
+  stands for C(numberInteriorTiles, numberMines - K) boards, one for
+  each way of placing the other mines in the interior. The
+  probabilities are exact unless those numbers of boards need more
+  than CONST_PROBABILITY_WEIGHT_BITS bits, in which case they are
+  rounded to that precision.
+
+  Parameters
+  ----------
+  components : list
+    One (solutionCounts, mineCounts) pair per component. solutionCounts
+    maps a number of mines to the number of solutions of the component
+    placing that many mines, and mineCounts maps it to the list of how
+    many of those solutions put a mine on each variable
+  numberInteriorTiles : int
+    The number of unknown tiles outside every component
+  numberMines : int
+    The number of mines not yet found by the player
+
+  Returns
+  -------
+  list
+    For each component, the list of mine probabilities of its variables
+    as Fractions, or None if no board is consistent with the constraints
+  Fraction
+    The mine probability of every interior tile
+  """
+  # Joint solution counts of the components before each component
+  componentCounts = [solutionCounts for solutionCounts, mineCounts in components]
+  prefixCounts = [{0: 1}]
+  for solutionCounts in componentCounts:
+    prefixCounts.append(convolveCounts(prefixCounts[-1], solutionCounts))
+  allCounts = prefixCounts[-1]
+  if not allCounts:
+    return None, None
+
+  # Only the ratios between the numbers of interior placements matter,
+  # so every weight below is scaled by the same unknown factor
+  kLow = max(0, numberMines - max(allCounts))
+  kHigh = min(numberInteriorTiles, numberMines - min(allCounts))
+  if kLow > kHigh:
+    return None, None
+  combinationWeights = countCombinationWeights(numberInteriorTiles, kLow, kHigh)
+  # Every weight used below belongs to a number of mines the components
+  # can place, so they are rounded relative to the largest of those
+  largestWeight = max(combinationWeights[numberMines - frontierMines - kLow] for frontierMines in allCounts if kLow <= numberMines - frontierMines <= kHigh)
+  shift = max(0, largestWeight.bit_length() - CONST_PROBABILITY_WEIGHT_BITS)
+  combinationWeights = [weight >> shift for weight in combinationWeights]
+
+  def interiorWeight(frontierMines):
+    """Returns the scaled number of ways to place the other mines in the interior
+    """
+    k = numberMines - frontierMines
+    return combinationWeights[k - kLow] if kLow <= k <= kHigh else 0
+
+  # For each component and each number of mines placed by the
+  # components before it, the weight of every way to complete the board
+  # with the components from it on and the interior. Working backwards
+  # from the last component, each table takes one pass over the
+  # solution counts of a single component, rather than a convolution of
+  # all the others
+  tailWeights = [None] * len(components) + [{frontierMines: interiorWeight(frontierMines) for frontierMines in allCounts}]
+  for index in range(len(components) - 1, -1, -1):
+    nextWeights = tailWeights[index + 1]
+    tailWeights[index] = {previousMines: sum(solutions * nextWeights[previousMines + componentMines] for componentMines, solutions in componentCounts[index].items()) for previousMines in prefixCounts[index]}
+
+  totalWeight = tailWeights[0][0]
+  if totalWeight == 0:
+    return None, None
+  # An interior tile holds a mine in C(n - 1, k - 1) = C(n, k) * k / n
+  # of the placements of k mines among the n interior tiles
+  if numberInteriorTiles == 0:
+    interiorProbability = Fraction(0)
+  else:
+    interiorMineWeight = sum(solutions * interiorWeight(frontierMines) * (numberMines - frontierMines) for frontierMines, solutions in allCounts.items())
+    interiorProbability = Fraction(interiorMineWeight, totalWeight * numberInteriorTiles)
+
+  probabilities = []
+  for index, (solutionCounts, mineCounts) in enumerate(components):
+    # The weight of the rest of the board once this component places
+    # a given number of mines
+    nextWeights = tailWeights[index + 1]
+    restWeights = {componentMines: sum(solutions * nextWeights[previousMines + componentMines] for previousMines, solutions in prefixCounts[index].items()) for componentMines in solutionCounts}
+    mineWeights = None
+    for componentMines, variableCounts in mineCounts.items():
+      weights = [count * restWeights[componentMines] for count in variableCounts]
+      mineWeights = weights if mineWeights is None else [total + weight for total, weight in zip(mineWeights, weights)]
+    probabilities.append([Fraction(weight, totalWeight) for weight in mineWeights])
+  return probabilities, interiorProbability
@@ -0,0 +1,174 @@
+# Import necessary Python libraries
+import sys
+
+# Rendering levels, from no output at all to the full trace of a game
+CONST_RENDER_SILENT = 0
+CONST_RENDER_FINAL = 1
+CONST_RENDER_BUFFERED = 2
+CONST_RENDER_INCREMENTAL = 3
+
+def formatBoard(board):
+  """Formats a 2D board as rows of space separated tiles
+
+  Parameters
+  ----------
+  board : array
+    The 2D array of tiles to format
+  """
+  return '\n'.join([' '.join([str(cell) for cell in row]) for row in board])
+
+def createRenderer(level, stream=None):
+  """Creates the renderer for a rendering level
+
+  Parameters
+  ----------
+  level : int
+    One of the CONST_RENDER_* levels
+  stream : file, optional
+    The stream that output is written to (default is sys.stdout)
+  """
+  if level == CONST_RENDER_SILENT:
+    return MineSweeperRenderer()
+  if level == CONST_RENDER_FINAL:
+    return FinalBoardRenderer(stream)
+  if level == CONST_RENDER_BUFFERED:
+    return BufferedRenderer(stream)
+  if level == CONST_RENDER_INCREMENTAL:
+    return IncrementalRenderer(stream)
+  raise ValueError('invalid rendering level selected')
+
+class MineSweeperRenderer:
+  """Renderer interface used by the boards, the player and the game loop
+
+  The base class is the silent (headless) renderer: every method
+  ignores its arguments, so no board is ever converted to text. Boards
+  and players are passed as objects and only formatted by renderers
+  that actually produce output.
+  """
+
+  def renderMessage(self, message):
+    """Renders a status message such as 'player has won!'
+
+    Parameters
+    ----------
+    message : str
+      The message to render
+    """
+    pass
+
+  def renderMove(self, x, y):
+    """Renders the move chosen by the player
+
+    Parameters
+    ----------
+    x : int
+      x coordinate of the tile selected
+    y : int
+      y coordinate of the tile selected
+    """
+    pass
+
+  def renderBoard(self, board):
+    """Renders the player's view of a board after a move
+
+    Parameters
+    ----------
+    board : MineSweeperBoard
+      The board to render
+    """
+    pass
+
+  def renderPlayer(self, player):
+    """Renders the player's mind map before it returns a move
+
+    Parameters
+    ----------
+    player : MineSweeperPlayer
+      The player to render
+    """
+    pass
+
+  def finishGame(self, board):
+    """Renders the end of a game
+
+    Parameters
+    ----------
+    board : MineSweeperBoard
+      The board of the game that just ended
+    """
+    pass
+
+class FinalBoardRenderer(MineSweeperRenderer):
+  """Renderer that only writes the final board of every game"""
+
+  def __init__(self, stream=None):
+    """
+    Parameters
+    ----------
+    stream : file, optional
+      The stream that output is written to (default is sys.stdout)
+    """
+    self.stream = stream
+
+  def _write(self, text):
+    """Writes text to the output stream
+
+    Parameters
+    ----------
+    text : str
+      The text to write
+    """
+    (self.stream or sys.stdout).write(text)
+
+  def finishGame(self, board):
+    self._write('\n\n' + formatBoard(board.getPlayerBoard()) + '\n\n\n')
+
+class IncrementalRenderer(FinalBoardRenderer):
+  """Renderer that writes the full trace of a game as it is played
+
+  This reproduces the original output of the game: every status
+  message, every move, the board after each move and the player's
+  mind map before each move.
+  """
+
+  def renderMessage(self, message):
+    self._write(message + '\n')
+
+  def renderMove(self, x, y):
+    self._write('player chose move: {},{}\n'.format(x, y))
+
+  def renderBoard(self, board):
+    self._write('\n\n' + formatBoard(board.getPlayerBoard()) + '\n\n\n')
+
+  def renderPlayer(self, player):
+    if player.playerBoard == None:
+      self._write('\nPLAYER MIND MAP\nplayer has not yet seen the board!\n\n\n')
+    else:
+      self._write('\nPLAYER MIND MAP\n' + formatBoard(player.playerBoard) + '\n\n\n')
+
+  def finishGame(self, board):
+    pass
+
+class BufferedRenderer(IncrementalRenderer):
+  """Renderer that collects the full trace of a game and writes it at once
+
+  The text is the same as the IncrementalRenderer's, but it is kept in
+  memory and written to the stream in a single call when the game ends.
+  """
+
+  def __init__(self, stream=None):
+    """
+    Parameters
+    ----------
+    stream : file, optional
+      The stream that output is written to (default is sys.stdout)
+    """
+    IncrementalRenderer.__init__(self, stream)
+    self.buffer = []
+
+  def _write(self, text):
+    self.buffer.append(text)
+
+  def finishGame(self, board):
+    (self.stream or sys.stdout).write(''.join(self.buffer))
+    self.buffer = []
@@ -0,0 +1,57 @@
+def solveSubsetConstraints(constraints):
+  """Deduces forced variables with the subset rule
+
+  If the variables of constraint A are a subset of the variables of
+  constraint B, then the variables of B that are not in A hold exactly
+  sum(B) - sum(A) mines. Such a difference is a constraint of its own:
+  when it is 0 all of its variables are safe, when it equals its
+  number of variables all of them are mines, and otherwise it can be
+  combined with the other constraints again.
+
+  Constraints are indexed by the frozenset of their variables, which
+  also drops duplicates, and every variable has a bucket of the
+  constraints containing it. Only constraints sharing a bucket with A
+  can be its subsets, and any superset of A is in every one of its
+  buckets, so the search never looks at unrelated constraints. No
+  constraint.Problem is built.
+
+  Parameters
+  ----------
+  constraints : list
+    (tile, total, variables) constraint equations, as built by the player
+
+  Returns
+  -------
+  dict
+    The forced value (0 or 1) of each forced variable
+  """
+  totals = {}
+  buckets = {}
+  worklist = []
+  forcedValues = {}
+
+  def addConstraint(variables, total):
+    """Indexes a constraint that has not been seen yet"""
+    if not variables or variables in totals:
+      return
+    totals[variables] = total
+    for variable in variables:
+      buckets.setdefault(variable, set()).add(variables)
+    worklist.append(variables)
+
+  for constraint in constraints:
+    addConstraint(frozenset(constraint[2]), constraint[1])
+  while worklist:
+    variables = worklist.pop()
+    total = totals[variables]
+    if total == 0 or total == len(variables):
+      for variable in variables:
+        forcedValues[variable] = 0 if total == 0 else 1
+    # Supersets are all in the smallest bucket; subsets can be in any
+    for otherVariables in list(min((buckets[variable] for variable in variables), key=len)):
+      if variables < otherVariables:
+        addConstraint(otherVariables - variables, totals[otherVariables] - total)
+    for otherVariables in set().union(*[buckets[variable] for variable in variables]):
+      if otherVariables < variables:
+        addConstraint(variables - otherVariables, total - totals[otherVariables])
+  return forcedValues
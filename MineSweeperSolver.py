@@ -0,0 +1,451 @@
+# Import necessary Python libraries
+import time
+from collections import OrderedDict
+from constraint import Problem, ExactSumConstraint, PropagatingSolver
+
+# Backends that the player can count the solutions of its constraints with
+CONST_SOLVER_BACKEND_CONSTRAINT = 0
+CONST_SOLVER_BACKEND_BITMASK = 1
+CONST_SOLVER_BACKEND_PROPAGATING = 2
+
+# Number of search nodes visited between two checks of the deadline
+CONST_SOLVER_DEADLINE_INTERVAL = 64
+
+# Number of constraint sets whose solutions a CachingSolver remembers
+CONST_SOLVER_CACHE_SIZE = 4096
+
+# Number of set bits in an integer
+if hasattr(int, 'bit_count'):
+  popcount = int.bit_count
+else:
+  def popcount(value):
+    return bin(value).count('1')
+
+def createSolver(backend):
+  """Creates the solver for a solver backend
+
+  Parameters
+  ----------
+  backend : int
+    One of the CONST_SOLVER_BACKEND_* backends
+  """
+  if backend == CONST_SOLVER_BACKEND_CONSTRAINT:
+    return ConstraintSolver()
+  if backend == CONST_SOLVER_BACKEND_BITMASK:
+    return BitmaskSolver()
+  if backend == CONST_SOLVER_BACKEND_PROPAGATING:
+    return ConstraintSolver(PropagatingSolver())
+  raise ValueError('invalid solver backend selected')
+
+def getForcedValues(uniqueVariables, solutionCounts, mineCounts, isComplete):
+  """Finds the variables that take the same value in every solution
+
+  Nothing is forced if the search was stopped before it was complete,
+  since the missing solutions could disagree.
+
+  Parameters
+  ----------
+  uniqueVariables, solutionCounts, mineCounts, isComplete
+    The results of a countSolutions() call
+
+  Returns
+  -------
+  dict
+    The forced value (0 or 1) of each forced variable
+  """
+  forcedValues = {}
+  numberSolutions = sum(solutionCounts.values())
+  if numberSolutions != 0 and isComplete:
+    totalMineCounts = [sum(counts) for counts in zip(*mineCounts.values())]
+    for variable, mineCount in zip(uniqueVariables, totalMineCounts):
+      if mineCount == 0:
+        forcedValues[variable] = 0
+      if mineCount == numberSolutions:
+        forcedValues[variable] = 1
+  return forcedValues
+
+def getSignature(constraints):
+  """Computes the signature of a set of constraints
+
+  The variables are relabelled 0, 1, 2... in the order they first
+  appear when the constraints are taken by tile and their variables by
+  index. The signature is the list of the constraint totals with the
+  labels of their variables. It does not depend on where the tiles
+  are on the board, so constraint sets of the same shape share it,
+  and any two sets with the same signature have the same solutions
+  once their variables are matched by label.
+
+  Parameters
+  ----------
+  constraints : list
+    (tile, total, variables) constraint equations
+
+  Returns
+  -------
+  tuple
+    The signature of the constraints
+  list
+    The variables, in the order of their labels
+  """
+  labels = {}
+  signature = []
+  for constraint in sorted(constraints):
+    variables = sorted(constraint[2])
+    for variable in variables:
+      if variable not in labels:
+        labels[variable] = len(labels)
+    signature.append((constraint[1], tuple(labels[variable] for variable in variables)))
+  return tuple(signature), list(labels)
+
+class MineSweeperSolver:
+  """Base class of the solver backends"""
+
+  def countSolutions(self, constraints, deadline=None):
+    """Counts the solutions of a set of constraints
+
+    Parameters
+    ----------
+    constraints : list
+      (tile, total, variables) constraint equations to solve together
+    deadline : float, optional
+      The time.time() value at which the search stops; the counts then
+      only cover the solutions found so far
+
+    Returns
+    -------
+    list
+      The variables of the constraints
+    dict
+      The number of solutions for each number of mines they place
+    dict
+      For each number of mines, the list of how many of those solutions
+      place a mine on each variable
+    bool
+      False if the search was stopped by the deadline
+    """
+    raise NotImplementedError('%s is an abstract class' % self.__class__.__name__)
+
+  def solveConstraints(self, constraints, deadline=None):
+    """Finds the variables forced by a set of constraints
+
+    Parameters
+    ----------
+    constraints : list
+      (tile, total, variables) constraint equations to solve together
+    deadline : float, optional
+      The time.time() value at which the search stops; nothing is
+      forced if it is reached
+
+    Returns
+    -------
+    dict
+      The forced value (0 or 1) of each forced variable
+    """
+    return getForcedValues(*self.countSolutions(constraints, deadline))
+
+class ConstraintSolver(MineSweeperSolver):
+  """Counts solutions with the general purpose constraint.Problem solver"""
+
+  def __init__(self, solver=None):
+    """Initializes the solver
+
+    Parameters
+    ----------
+    solver : constraint.Solver, optional
+      The search algorithm of the problem (default is the
+      constraint.BacktrackingSolver)
+    """
+    self.constraintProblem = Problem(solver)
+    # Number of search nodes visited by all the searches with a deadline
+    self.nodes = 0
+
+  def countSolutions(self, constraints, deadline=None):
+    """Counts the solutions of a set of constraints
+
+    The solutions are streamed from the solver one at a time and only
+    the number of solutions in which each variable holds a mine is
+    kept, so memory stays proportional to the number of variables no
+    matter how many solutions there are. The counts are kept apart for
+    every number of mines the solutions place, as needed to weigh them
+    against the rest of the board.
+
+    Parameters
+    ----------
+    constraints : list
+      (tile, total, variables) constraint equations to solve together
+    deadline : float, optional
+      The time.time() value at which the search stops; the counts then
+      only cover the solutions found so far
+
+    Returns
+    -------
+    list
+      The variables of the constraints
+    dict
+      The number of solutions for each number of mines they place
+    dict
+      For each number of mines, the list of how many of those solutions
+      place a mine on each variable
+    bool
+      False if the search was stopped by the deadline
+    """
+    constraintProblem = self.constraintProblem
+    constraintProblem.reset()
+    uniqueVariables = list(set(variable for constraint in constraints for variable in constraint[2]))
+    constraintProblem.addVariables(uniqueVariables, [0,1])
+    for constraint in constraints:
+      constraintProblem.addConstraint(ExactSumConstraint(constraint[1]), constraint[2])
+    solutionCounts = {}
+    mineCounts = {}
+    for solution in constraintProblem.getSolutionIter(deadline=deadline):
+      values = [solution[variable] for variable in uniqueVariables]
+      numberMines = sum(values)
+      if numberMines not in solutionCounts:
+        solutionCounts[numberMines] = 0
+        mineCounts[numberMines] = [0] * len(uniqueVariables)
+      solutionCounts[numberMines] += 1
+      counts = mineCounts[numberMines]
+      for position, value in enumerate(values):
+        counts[position] += value
+    if constraintProblem.getSearchLimit() is not None:
+      self.nodes += constraintProblem.getSearchLimit().nodes
+    return uniqueVariables, solutionCounts, mineCounts, constraintProblem.isSearchComplete()
+
+class BitmaskSolver(MineSweeperSolver):
+  """Counts solutions with a search specialized for Minesweeper constraints
+
+  Every variable is a single bit. An assignment is held in two
+  integers, the bits that have been assigned and the bits that hold a
+  mine, and every constraint is the bitmask of its variables with a
+  mine total. A constraint is checked with two popcounts: the mines it
+  already holds and its unassigned variables. When a constraint has
+  all of its mines, its other variables are set to 0, and when it
+  needs all of its unassigned variables, they are set to 1. These
+  forced values are propagated before the next variable is chosen.
+  Undoing an assignment is just restoring the two integers.
+  """
+
+  def __init__(self):
+    # Number of search nodes visited by all the searches
+    self.nodes = 0
+
+  def countSolutions(self, constraints, deadline=None):
+    """Counts the solutions of a set of constraints
+
+    This returns the same counts as ConstraintSolver.countSolutions().
+
+    Parameters
+    ----------
+    constraints : list
+      (tile, total, variables) constraint equations to solve together
+    deadline : float, optional
+      The time.time() value at which the search stops; the counts then
+      only cover the solutions found so far
+
+    Returns
+    -------
+    list
+      The variables of the constraints
+    dict
+      The number of solutions for each number of mines they place
+    dict
+      For each number of mines, the list of how many of those solutions
+      place a mine on each variable
+    bool
+      False if the search was stopped by the deadline
+    """
+    # Number the variables in breadth first order through the
+    # constraints, so that the lowest unassigned bit is always close to
+    # the variables assigned before it
+    variableConstraints = {}
+    for constraintIndex, constraint in enumerate(constraints):
+      for variable in constraint[2]:
+        variableConstraints.setdefault(variable, []).append(constraintIndex)
+    uniqueVariables = []
+    positions = {}
+    visitedConstraints = set()
+    for firstVariable in sorted(variableConstraints):
+      if firstVariable in positions:
+        continue
+      positions[firstVariable] = len(uniqueVariables)
+      uniqueVariables.append(firstVariable)
+      queue = [firstVariable]
+      while queue:
+        variable = queue.pop(0)
+        for constraintIndex in variableConstraints[variable]:
+          if constraintIndex in visitedConstraints:
+            continue
+          visitedConstraints.add(constraintIndex)
+          for otherVariable in constraints[constraintIndex][2]:
+            if otherVariable not in positions:
+              positions[otherVariable] = len(uniqueVariables)
+              uniqueVariables.append(otherVariable)
+              queue.append(otherVariable)
+
+    masks = []
+    totals = []
+    for constraint in constraints:
+      mask = 0
+      for variable in constraint[2]:
+        mask |= 1 << positions[variable]
+      masks.append(mask)
+      totals.append(constraint[1])
+    bitConstraints = [[] for variable in uniqueVariables]
+    for constraintIndex, mask in enumerate(masks):
+      remaining = mask
+      while remaining:
+        bit = remaining & -remaining
+        bitConstraints[bit.bit_length() - 1].append(constraintIndex)
+        remaining ^= bit
+    allAssigned = (1 << len(uniqueVariables)) - 1
+
+    solutionCounts = {}
+    mineCounts = {}
+    isComplete = True
+
+    def propagate(assigned, mines, pending):
+      """Checks the pending constraints and assigns the values they force
+
+      Returns the new (assigned, mines) pair, or None on a conflict.
+      """
+      while pending:
+        constraintIndex = pending.pop()
+        mask = masks[constraintIndex]
+        numberMines = popcount(mines & mask)
+        unassigned = mask & ~assigned
+        numberUnassigned = popcount(unassigned)
+        total = totals[constraintIndex]
+        if numberMines > total or numberMines + numberUnassigned < total:
+          return None
+        if numberUnassigned == 0:
+          continue
+        if numberMines == total:
+          assigned |= unassigned
+        elif numberMines + numberUnassigned == total:
+          assigned |= unassigned
+          mines |= unassigned
+        else:
+          continue
+        while unassigned:
+          bit = unassigned & -unassigned
+          pending.extend(bitConstraints[bit.bit_length() - 1])
+          unassigned ^= bit
+      return assigned, mines
+
+    # Depth first search over the partial assignments still to extend.
+    # An explicit stack is used rather than recursion, since a wide
+    # frontier can decide more variables than the recursion limit
+    result = propagate(0, 0, list(range(len(constraints))))
+    stack = [] if result is None else [result]
+    while stack:
+      assigned, mines = stack.pop()
+      self.nodes += 1
+      if deadline is not None and self.nodes % CONST_SOLVER_DEADLINE_INTERVAL == 0 and time.time() >= deadline:
+        isComplete = False
+        break
+      if assigned == allAssigned:
+        numberMines = popcount(mines)
+        if numberMines not in solutionCounts:
+          solutionCounts[numberMines] = 0
+          mineCounts[numberMines] = [0] * len(uniqueVariables)
+        solutionCounts[numberMines] += 1
+        counts = mineCounts[numberMines]
+        while mines:
+          bit = mines & -mines
+          counts[bit.bit_length() - 1] += 1
+          mines ^= bit
+        continue
+      # Both values of the lowest unassigned bit are tried, 0 first
+      bit = ~assigned & (assigned + 1)
+      for value in (bit, 0):
+        result = propagate(assigned | bit, mines | value, list(bitConstraints[bit.bit_length() - 1]))
+        if result is not None:
+          stack.append(result)
+    return uniqueVariables, solutionCounts, mineCounts, isComplete
+
+class CachingSolver(MineSweeperSolver):
+  """Remembers the solutions of the constraint sets another solver counted
+
+  Most of the frontier does not change from one move to the next, and
+  the same small shapes of constraints appear all over the board. The
+  counts and the forced values of every complete search are kept under
+  the signature of its constraints, so solving a set of constraints
+  that was solved before, here or anywhere else on the board, costs a
+  lookup instead of a search. The least recently used entries are
+  dropped once the cache is full.
+  """
+
+  def __init__(self, solver, maxsize=CONST_SOLVER_CACHE_SIZE):
+    """Initializes the cache
+
+    Parameters
+    ----------
+    solver : MineSweeperSolver
+      The solver counting the solutions of the sets not in the cache
+    maxsize : int, optional
+      The number of constraint sets to remember
+    """
+    self.solver = solver
+    self.maxsize = maxsize
+    self.entries = OrderedDict()
+    self.hits = 0
+    self.misses = 0
+
+  @property
+  def nodes(self):
+    """Returns the number of search nodes visited by the wrapped solver"""
+    return self.solver.nodes
+
+  def __getEntry(self, constraints, deadline):
+    """Returns the cached results of a set of constraints, solving it if needed
+
+    Returns
+    -------
+    list
+      The variables of the constraints, in the order of their labels
+    tuple
+      The solution counts, mine counts and forced values (as label,
+      value pairs) of the constraints, or None if the search was
+      stopped by the deadline
+    tuple
+      The results of the search, if one was needed
+    """
+    signature, variables = getSignature(constraints)
+    entry = self.entries.get(signature)
+    if entry is not None:
+      self.hits += 1
+      self.entries.move_to_end(signature)
+      return variables, entry, None
+    self.misses += 1
+    results = self.solver.countSolutions(constraints, deadline)
+    uniqueVariables, solutionCounts, mineCounts, isComplete = results
+    if not isComplete:
+      return variables, None, results
+    positions = dict((variable, position) for position, variable in enumerate(uniqueVariables))
+    mineCounts = dict((numberMines, [counts[positions[variable]] for variable in variables]) for numberMines, counts in mineCounts.items())
+    forcedValues = getForcedValues(variables, solutionCounts, mineCounts, isComplete)
+    entry = (solutionCounts, mineCounts, tuple((label, forcedValues[variable]) for label, variable in enumerate(variables) if variable in forcedValues))
+    self.entries[signature] = entry
+    if len(self.entries) > self.maxsize:
+      self.entries.popitem(last=False)
+    return variables, entry, results
+
+  def countSolutions(self, constraints, deadline=None):
+    """Counts the solutions of a set of constraints
+
+    See MineSweeperSolver.countSolutions().
+    """
+    variables, entry, results = self.__getEntry(constraints, deadline)
+    if entry is None:
+      return results
+    return variables, entry[0], entry[1], True
+
+  def solveConstraints(self, constraints, deadline=None):
+    """Finds the variables forced by a set of constraints
+
+    See MineSweeperSolver.solveConstraints().
+    """
+    variables, entry, results = self.__getEntry(constraints, deadline)
+    if entry is None:
+      return {}
+    return dict((variables[label], value) for label, value in entry[2])
@@ -39,6 +39,7 @@ from .version import __url__  # noqa
 
 import random
 import copy
+import time
 from .compat import xrange
 
 __all__ = [
@@ -46,9 +47,11 @@ __all__ = [
     "Variable",
     "Domain",
     "Unassigned",
+    "SearchLimit",
     "Solver",
     "BacktrackingSolver",
     "RecursiveBacktrackingSolver",
+    "PropagatingSolver",
     "MinConflictsSolver",
     "Constraint",
     "FunctionConstraint",
@@ -78,6 +81,7 @@ class Problem(object):
         self._solver = solver or BacktrackingSolver()
         self._constraints = []
         self._variables = {}
+        self._limit = None
 
     def reset(self):
         """
@@ -209,7 +213,7 @@ class Problem(object):
                 raise ValueError(msg)
         self._constraints.append((constraint, variables))
 
-    def getSolution(self):
+    def getSolution(self, deadline=None, maxnodes=None):
         """
         Find and return a solution to the problem
 
@@ -222,18 +226,32 @@ class Problem(object):
         >>> problem.getSolution()
         {'a': 42}
 
-        @return: Solution for the problem
+        @param deadline: Wall-clock time, as returned by C{time.time()},
+                         after which the search stops (default is no
+                         deadline)
+        @type  deadline: float
+        @param maxnodes: Maximum number of search nodes to visit (default
+                         is no maximum)
+        @type  maxnodes: int
+        @return: Solution for the problem, or None if there is none or
+                 the search was stopped by a limit (see L{isSearchComplete})
         @rtype: dictionary mapping variables to values
         """
         domains, constraints, vconstraints = self._getArgs()
+        self._limit = self._makeLimit(deadline, maxnodes)
         if not domains:
             return None
-        return self._solver.getSolution(domains, constraints, vconstraints)
+        if self._limit is None:
+            return self._solver.getSolution(domains, constraints, vconstraints)
+        return self._solver.getSolution(domains, constraints, vconstraints, self._limit)
 
-    def getSolutions(self):
+    def getSolutions(self, deadline=None, maxnodes=None):
         """
         Find and return all solutions to the problem
 
+        When a limit is given and reached, the solutions found so far are
+        returned and L{isSearchComplete} returns False.
+
         Example:
 
         >>> problem = Problem()
@@ -242,19 +260,37 @@ class Problem(object):
         >>> problem.addVariables(["a"], [42])
         >>> problem.getSolutions()
         [{'a': 42}]
-
+        >>> problem.addVariables(["b", "c"], [1, 2, 3])
+        >>> len(problem.getSolutions(maxnodes=5))
+        3
+        >>> problem.isSearchComplete()
+        False
+
+        @param deadline: Wall-clock time, as returned by C{time.time()},
+                         after which the search stops (default is no
+                         deadline)
+        @type  deadline: float
+        @param maxnodes: Maximum number of search nodes to visit (default
+                         is no maximum)
+        @type  maxnodes: int
         @return: All solutions for the problem
         @rtype: list of dictionaries mapping variables to values
         """
         domains, constraints, vconstraints = self._getArgs()
+        self._limit = self._makeLimit(deadline, maxnodes)
         if not domains:
             return []
-        return self._solver.getSolutions(domains, constraints, vconstraints)
+        if self._limit is None:
+            return self._solver.getSolutions(domains, constraints, vconstraints)
+        return self._solver.getSolutions(domains, constraints, vconstraints, self._limit)
 
-    def getSolutionIter(self):
+    def getSolutionIter(self, deadline=None, maxnodes=None):
         """
         Return an iterator to the solutions of the problem
 
+        When a limit is given and reached, the iterator stops early and
+        L{isSearchComplete} returns False once it is exhausted.
+
         Example:
 
         >>> problem = Problem()
@@ -268,11 +304,61 @@ class Problem(object):
         Traceback (most recent call last):
           File "<stdin>", line 1, in ?
         StopIteration
+
+        @param deadline: Wall-clock time, as returned by C{time.time()},
+                         after which the search stops (default is no
+                         deadline)
+        @type  deadline: float
+        @param maxnodes: Maximum number of search nodes to visit (default
+                         is no maximum)
+        @type  maxnodes: int
         """
         domains, constraints, vconstraints = self._getArgs()
+        self._limit = self._makeLimit(deadline, maxnodes)
         if not domains:
             return iter(())
-        return self._solver.getSolutionIter(domains, constraints, vconstraints)
+        if self._limit is None:
+            return self._solver.getSolutionIter(domains, constraints, vconstraints)
+        return self._solver.getSolutionIter(domains, constraints, vconstraints, self._limit)
+
+    def isSearchComplete(self):
+        """
+        Tell whether the last search explored the whole search space
+
+        Example:
+
+        >>> problem = Problem()
+        >>> problem.addVariables(["a", "b"], [1, 2, 3])
+        >>> len(problem.getSolutions(maxnodes=100))
+        9
+        >>> problem.isSearchComplete()
+        True
+        >>> len(problem.getSolutions(deadline=0))
+        0
+        >>> problem.isSearchComplete()
+        False
+
+        @return: False if the last call to L{getSolution},
+                 L{getSolutions} or L{getSolutionIter} was stopped by its
+                 deadline or node limit
+        @rtype: bool
+        """
+        return self._limit is None or not self._limit.expired
+
+    def getSearchLimit(self):
+        """
+        Obtain the limit used by the last search, if it had one
+
+        @return: Limit of the last search, whose C{nodes} attribute holds
+                 the number of search nodes that were visited
+        @rtype: instance of L{SearchLimit}, or None
+        """
+        return self._limit
+
+    def _makeLimit(self, deadline, maxnodes):
+        if deadline is None and maxnodes is None:
+            return None
+        return SearchLimit(deadline, maxnodes)
 
     def _getArgs(self):
         domains = self._variables.copy()
@@ -366,11 +452,63 @@ def doArc8(arcs, domains, assignments):
     return True
 
 
+class SearchLimit(object):
+    """
+    Deadline and node budget of a search
+
+    Solvers supporting limits receive an instance as their last argument
+    and call L{visitNode} for every value they try. Once a limit is
+    reached the solver stops cleanly and C{expired} is set.
+
+    Example:
+
+    >>> limit = SearchLimit(maxnodes=2)
+    >>> limit.visitNode(), limit.visitNode(), limit.visitNode()
+    (True, True, False)
+    >>> limit.expired, limit.nodes
+    (True, 3)
+    """
+
+    def __init__(self, deadline=None, maxnodes=None):
+        """
+        @param deadline: Wall-clock time, as returned by C{time.time()},
+                         after which the search stops (default is no
+                         deadline)
+        @type  deadline: float
+        @param maxnodes: Maximum number of search nodes to visit (default
+                         is no maximum)
+        @type  maxnodes: int
+        """
+        self.deadline = deadline
+        self.maxnodes = maxnodes
+        self.nodes = 0
+        self.expired = False
+
+    def visitNode(self):
+        """
+        Count a search node and check the limits
+
+        @return: False if a limit was reached and the search must stop
+        @rtype: bool
+        """
+        self.nodes += 1
+        if self.maxnodes is not None and self.nodes > self.maxnodes:
+            self.expired = True
+        elif self.deadline is not None and time.time() >= self.deadline:
+            self.expired = True
+        return not self.expired
+
+
 class Solver(object):
     """Abstract base class for solvers
+
+    Solvers accept a L{SearchLimit} as an extra last argument of their
+    methods. L{Problem} only passes one when a deadline or a node limit
+    is requested, so solvers that do not support limits keep working
+    without one.
     """
 
-    def getSolution(self, domains, constraints, vconstraints):
+    def getSolution(self, domains, constraints, vconstraints, limit=None):
         """
         Return one solution for the given problem
 
@@ -381,11 +519,14 @@ class Solver(object):
         @param vconstraints: Dictionary mapping variables to a list of
                              constraints affecting the given variables.
         @type  vconstraints: dict
+        @param limit: Deadline and node budget of the search (default is
+                      no limit)
+        @type  limit: instance of L{SearchLimit}
         """
         msg = "%s is an abstract class" % self.__class__.__name__
         raise NotImplementedError(msg)
 
-    def getSolutions(self, domains, constraints, vconstraints):
+    def getSolutions(self, domains, constraints, vconstraints, limit=None):
         """
         Return all solutions for the given problem
 
@@ -396,11 +537,14 @@ class Solver(object):
         @param vconstraints: Dictionary mapping variables to a list of
                              constraints affecting the given variables.
         @type  vconstraints: dict
+        @param limit: Deadline and node budget of the search (default is
+                      no limit)
+        @type  limit: instance of L{SearchLimit}
         """
         msg = "%s provides only a single solution" % self.__class__.__name__
         raise NotImplementedError(msg)
 
-    def getSolutionIter(self, domains, constraints, vconstraints):
+    def getSolutionIter(self, domains, constraints, vconstraints, limit=None):
         """
         Return an iterator for the solutions of the given problem
 
@@ -411,6 +555,9 @@ class Solver(object):
         @param vconstraints: Dictionary mapping variables to a list of
                              constraints affecting the given variables.
         @type  vconstraints: dict
+        @param limit: Deadline and node budget of the search (default is
+                      no limit)
+        @type  limit: instance of L{SearchLimit}
         """
         msg = "%s doesn't provide iteration" % self.__class__.__name__
         raise NotImplementedError(msg)
@@ -456,7 +603,7 @@ class BacktrackingSolver(Solver):
         """
         self._forwardcheck = forwardcheck
 
-    def getSolutionIter(self, domains, constraints, vconstraints):
+    def getSolutionIter(self, domains, constraints, vconstraints, limit=None):
         forwardcheck = self._forwardcheck
         assignments = {}
 
@@ -511,7 +658,14 @@ class BacktrackingSolver(Solver):
                     else:
                         return
 
-                # Got a value. Check it.
+                # Got a value. Check it, unless the search is out of
+                # time or nodes.
+                if limit is not None and not limit.visitNode():
+                    for _, _, pushdomains in queue:
+                        if pushdomains:
+                            for domain in pushdomains:
+                                domain.popState()
+                    return
                 assignments[variable] = values.pop()
 
                 if pushdomains:
@@ -534,15 +688,15 @@ class BacktrackingSolver(Solver):
 
         raise RuntimeError("Can't happen")
 
-    def getSolution(self, domains, constraints, vconstraints):
-        iter = self.getSolutionIter(domains, constraints, vconstraints)
+    def getSolution(self, domains, constraints, vconstraints, limit=None):
+        iter = self.getSolutionIter(domains, constraints, vconstraints, limit)
         try:
             return next(iter)
         except StopIteration:
             return None
 
-    def getSolutions(self, domains, constraints, vconstraints):
-        return list(self.getSolutionIter(domains, constraints, vconstraints))
+    def getSolutions(self, domains, constraints, vconstraints, limit=None):
+        return list(self.getSolutionIter(domains, constraints, vconstraints, limit))
 
 
 class RecursiveBacktrackingSolver(Solver):
@@ -573,6 +727,11 @@ class RecursiveBacktrackingSolver(Solver):
     Traceback (most recent call last):
        ...
     NotImplementedError: RecursiveBacktrackingSolver doesn't provide iteration
+
+    >>> problem.getSolution(deadline=0) is None
+    True
+    >>> problem.isSearchComplete()
+    False
     """
 
     def __init__(self, forwardcheck=True):
@@ -585,7 +744,7 @@ class RecursiveBacktrackingSolver(Solver):
         self._forwardcheck = forwardcheck
 
     def recursiveBacktracking(
-        self, solutions, domains, vconstraints, assignments, single
+        self, solutions, domains, vconstraints, assignments, single, limit=None
     ):
 
         # Mix the Degree and Minimum Remaing Values (MRV) heuristics
@@ -613,6 +772,9 @@ class RecursiveBacktrackingSolver(Solver):
             pushdomains = None
 
         for value in domains[variable]:
+            # Stop if the search is out of time or nodes.
+            if limit is not None and not limit.visitNode():
+                break
             assignments[variable] = value
             if pushdomains:
                 for domain in pushdomains:
@@ -624,22 +786,359 @@ class RecursiveBacktrackingSolver(Solver):
             else:
                 # Value is good. Recurse and get next variable.
                 self.recursiveBacktracking(
-                    solutions, domains, vconstraints, assignments, single
+                    solutions, domains, vconstraints, assignments, single, limit
                 )
                 if solutions and single:
                     return solutions
             if pushdomains:
                 for domain in pushdomains:
                     domain.popState()
+            if limit is not None and limit.expired:
+                break
         del assignments[variable]
         return solutions
 
-    def getSolution(self, domains, constraints, vconstraints):
-        solutions = self.recursiveBacktracking([], domains, vconstraints, {}, True)
+    def getSolution(self, domains, constraints, vconstraints, limit=None):
+        solutions = self.recursiveBacktracking(
+            [], domains, vconstraints, {}, True, limit
+        )
         return solutions and solutions[0] or None
 
-    def getSolutions(self, domains, constraints, vconstraints):
-        return self.recursiveBacktracking([], domains, vconstraints, {}, False)
+    def getSolutions(self, domains, constraints, vconstraints, limit=None):
+        return self.recursiveBacktracking(
+            [], domains, vconstraints, {}, False, limit
+        )
+
+
+class _PseudoBooleanSearch(object):
+    """
+    Search state of L{PropagatingSolver}
+
+    Variables are numbered, and the literal C{2 * variable + value}
+    stands for the variable taking that value, so that C{literal ^ 1} is
+    its negation. A constraint is a list of variables whose number of
+    ones must lie between a lower and an upper bound.
+    """
+
+    def __init__(self, numbervariables, constraints):
+        self.values = [-1] * numbervariables
+        self.levels = [0] * numbervariables
+        self.reasons = [None] * numbervariables
+        self.positions = [0] * numbervariables
+        self.trail = []
+        self.trailstarts = []
+        self.queuehead = 0
+        self.constraints = constraints
+        self.ones = [0] * len(constraints)
+        self.zeros = [0] * len(constraints)
+        self.vconstraints = [[] for _ in xrange(numbervariables)]
+        for index, (variables, _, _) in enumerate(constraints):
+            for variable in variables:
+                self.vconstraints[variable].append(index)
+        self.clauses = []
+        self.watches = [[] for _ in xrange(2 * numbervariables)]
+
+    def getLevel(self):
+        return len(self.trailstarts)
+
+    def assign(self, literal, reason):
+        # Reasons are None for decisions and facts, the index of a
+        # constraint, or ~index for a clause
+        variable = literal >> 1
+        value = literal & 1
+        self.values[variable] = value
+        self.levels[variable] = len(self.trailstarts)
+        self.reasons[variable] = reason
+        self.positions[variable] = len(self.trail)
+        self.trail.append(literal)
+        counters = value and self.ones or self.zeros
+        for index in self.vconstraints[variable]:
+            counters[index] += 1
+
+    def decide(self, literal):
+        self.trailstarts.append(len(self.trail))
+        self.assign(literal, None)
+
+    def backjump(self, level):
+        start = self.trailstarts[level]
+        values = self.values
+        for literal in self.trail[start:]:
+            variable = literal >> 1
+            counters = values[variable] and self.ones or self.zeros
+            for index in self.vconstraints[variable]:
+                counters[index] -= 1
+            values[variable] = -1
+        del self.trail[start:]
+        del self.trailstarts[level:]
+        self.queuehead = min(self.queuehead, start)
+
+    def checkConstraint(self, index):
+        """
+        Assign the variables a constraint forces
+
+        @return: The literals of the conflict clause, all false, if the
+                 constraint is violated, or None
+        """
+        variables, lowest, highest = self.constraints[index]
+        values = self.values
+        ones = self.ones[index]
+        possible = len(variables) - self.zeros[index]
+        if ones > highest:
+            return [2 * variable for variable in variables if values[variable] == 1]
+        if possible < lowest:
+            return [2 * variable + 1 for variable in variables if values[variable] == 0]
+        if ones == possible:
+            return None
+        if ones == highest:
+            for variable in variables:
+                if values[variable] == -1:
+                    self.assign(2 * variable, index)
+        elif possible == lowest:
+            for variable in variables:
+                if values[variable] == -1:
+                    self.assign(2 * variable + 1, index)
+        return None
+
+    def propagate(self):
+        """
+        Propagate every assignment not propagated yet
+
+        @return: The literals of a conflict clause, or None
+        """
+        values = self.values
+        trail = self.trail
+        while self.queuehead < len(trail):
+            literal = trail[self.queuehead]
+            self.queuehead += 1
+            for index in self.vconstraints[literal >> 1]:
+                conflict = self.checkConstraint(index)
+                if conflict is not None:
+                    return conflict
+            # Visit the clauses watching the literal that became false
+            falseliteral = literal ^ 1
+            watching = self.watches[falseliteral]
+            self.watches[falseliteral] = kept = []
+            for position, clauseindex in enumerate(watching):
+                clause = self.clauses[clauseindex]
+                if clause[0] == falseliteral:
+                    clause[0], clause[1] = clause[1], clause[0]
+                other = clause[0]
+                if values[other >> 1] == other & 1:
+                    kept.append(clauseindex)
+                    continue
+                for candidate in xrange(2, len(clause)):
+                    if values[clause[candidate] >> 1] != (clause[candidate] & 1) ^ 1:
+                        clause[1], clause[candidate] = clause[candidate], clause[1]
+                        self.watches[clause[1]].append(clauseindex)
+                        break
+                else:
+                    kept.append(clauseindex)
+                    if values[other >> 1] != -1:
+                        kept.extend(watching[position + 1:])
+                        return list(clause)
+                    self.assign(other, ~clauseindex)
+        return None
+
+    def getReason(self, variable):
+        """
+        Return the false literals that forced the value of a variable
+        """
+        reason = self.reasons[variable]
+        if reason < 0:
+            return [literal for literal in self.clauses[~reason] if literal >> 1 != variable]
+        values = self.values
+        positions = self.positions
+        before = positions[variable]
+        if values[variable] == 0:
+            # Forced to 0 by the ones that filled the constraint
+            return [
+                2 * other
+                for other in self.constraints[reason][0]
+                if values[other] == 1 and positions[other] < before
+            ]
+        return [
+            2 * other + 1
+            for other in self.constraints[reason][0]
+            if values[other] == 0 and positions[other] < before
+        ]
+
+    def analyzeConflict(self, conflict):
+        """
+        Derive the first unique implication point clause of a conflict
+
+        @return: The learned clause, starting with the literal it asserts
+        """
+        levels = self.levels
+        level = len(self.trailstarts)
+        seen = set()
+        learned = [None]
+        pending = 0
+        position = len(self.trail) - 1
+        literals = conflict
+        while True:
+            for literal in literals:
+                variable = literal >> 1
+                if variable in seen or levels[variable] == 0:
+                    continue
+                seen.add(variable)
+                if levels[variable] == level:
+                    pending += 1
+                else:
+                    learned.append(literal)
+            while self.trail[position] >> 1 not in seen:
+                position -= 1
+            variable = self.trail[position] >> 1
+            position -= 1
+            pending -= 1
+            if pending == 0:
+                learned[0] = self.trail[position + 1] ^ 1
+                return learned
+            literals = self.getReason(variable)
+
+    def addClause(self, clause):
+        """
+        Jump back to where a clause forces its first literal and assert it
+
+        All literals but the first must be false.
+        """
+        levels = self.levels
+        if len(clause) == 1:
+            self.backjump(0)
+            self.assign(clause[0], None)
+            return
+        # Watch the asserted literal and the latest of the others
+        latest = max(xrange(1, len(clause)), key=lambda position: levels[clause[position] >> 1])
+        clause[1], clause[latest] = clause[latest], clause[1]
+        self.backjump(levels[clause[1] >> 1])
+        self.clauses.append(clause)
+        index = len(self.clauses) - 1
+        self.watches[clause[0]].append(index)
+        self.watches[clause[1]].append(index)
+        self.assign(clause[0], ~index)
+
+
+class PropagatingSolver(Solver):
+    """
+    Problem solver for 0/1 sum constraints with propagation and conflict
+    learning
+
+    Aimed at problems whose variables take the values 0 and 1 and whose
+    constraints are L{ExactSumConstraint}, L{MaxSumConstraint} and
+    L{MinSumConstraint} without multipliers, such as the constraints of
+    a Minesweeper board. Each constraint keeps a counter of its
+    variables set to 1 and to 0, so assigning a variable only checks the
+    constraints it is part of, from a worklist. A constraint whose
+    bounds leave a single choice assigns the rest of its variables
+    right away. Conflicts are turned into learned clauses, watched
+    through two of their literals, and the search jumps back to the
+    level where the clause forces a value. Every solution found is
+    blocked by a clause before the search goes on to the next one.
+
+    Other problems are solved by a L{BacktrackingSolver}.
+
+    Examples:
+
+    >>> problem = Problem(PropagatingSolver())
+    >>> problem.addVariables(["a", "b", "c"], [0, 1])
+    >>> problem.addConstraint(ExactSumConstraint(1), ["a", "b"])
+    >>> problem.addConstraint(ExactSumConstraint(1), ["b", "c"])
+    >>> sorted(sorted(x.items()) for x in problem.getSolutions())
+    [[('a', 0), ('b', 1), ('c', 0)], [('a', 1), ('b', 0), ('c', 1)]]
+
+    >>> problem.addConstraint(MinSumConstraint(2), ["a", "c"])
+    >>> problem.getSolution()
+    {'a': 1, 'b': 0, 'c': 1}
+
+    >>> problem.addConstraint(MaxSumConstraint(1), ["a", "c"])
+    >>> problem.getSolutions()
+    []
+
+    >>> problem = Problem(PropagatingSolver())
+    >>> problem.addVariables(["a", "b"], [1, 2, 3])
+    >>> problem.addConstraint(lambda a, b: b > a, ["a", "b"])
+    >>> len(problem.getSolutions())
+    3
+    """
+
+    def __init__(self, forwardcheck=True):
+        """
+        @param forwardcheck: If false forward checking will not be requested
+                             to constraints when the problem is handed to a
+                             L{BacktrackingSolver} (default is true)
+        @type  forwardcheck: bool
+        """
+        self._fallback = BacktrackingSolver(forwardcheck)
+
+    def _getSumBounds(self, variables, domains, constraints):
+        # Express the problem as lists of variable numbers with bounds
+        # on their sum, or return None if it has another form
+        for domain in domains.values():
+            for value in domain:
+                if value not in (0, 1):
+                    return None
+        numbers = dict((variable, number) for number, variable in enumerate(variables))
+        bounds = []
+        for constraint, constrained in constraints:
+            if getattr(constraint, "_multipliers", None):
+                return None
+            scope = [numbers[variable] for variable in constrained]
+            if type(constraint) is ExactSumConstraint:
+                bounds.append((scope, constraint._exactsum, constraint._exactsum))
+            elif type(constraint) is MaxSumConstraint:
+                bounds.append((scope, 0, constraint._maxsum))
+            elif type(constraint) is MinSumConstraint:
+                bounds.append((scope, constraint._minsum, len(scope)))
+            else:
+                return None
+        return bounds
+
+    def getSolutionIter(self, domains, constraints, vconstraints, limit=None):
+        variables = list(domains)
+        bounds = self._getSumBounds(variables, domains, constraints)
+        if bounds is None:
+            for solution in self._fallback.getSolutionIter(domains, constraints, vconstraints, limit):
+                yield solution
+            return
+        search = _PseudoBooleanSearch(len(variables), bounds)
+        values = search.values
+        # Decide the most constrained variables first, trying 0 before 1
+        order = sorted(xrange(len(variables)), key=lambda number: -len(vconstraints[variables[number]]))
+        for number, variable in enumerate(variables):
+            if len(domains[variable]) == 1:
+                search.assign(2 * number + domains[variable][0], None)
+        for index in xrange(len(bounds)):
+            if search.checkConstraint(index) is not None:
+                return
+        while True:
+            conflict = search.propagate()
+            if conflict is not None:
+                if search.getLevel() == 0:
+                    return
+                search.addClause(search.analyzeConflict(conflict))
+                continue
+            for number in order:
+                if values[number] == -1:
+                    break
+            else:
+                yield dict((variable, values[number]) for number, variable in enumerate(variables))
+                if search.getLevel() == 0:
+                    return
+                # Block the decisions of this solution, latest first
+                search.addClause([search.trail[start] ^ 1 for start in reversed(search.trailstarts)])
+                continue
+            if limit is not None and not limit.visitNode():
+                return
+            search.decide(2 * number)
+
+    def getSolution(self, domains, constraints, vconstraints, limit=None):
+        iter = self.getSolutionIter(domains, constraints, vconstraints, limit)
+        try:
+            return next(iter)
+        except StopIteration:
+            return None
+
+    def getSolutions(self, domains, constraints, vconstraints, limit=None):
+        return list(self.getSolutionIter(domains, constraints, vconstraints, limit))
 
 
 class MinConflictsSolver(Solver):
@@ -669,6 +1168,11 @@ class MinConflictsSolver(Solver):
     Traceback (most recent call last):
        ...
     NotImplementedError: MinConflictsSolver doesn't provide iteration
+
+    >>> problem.getSolution(maxnodes=0) is None
+    True
+    >>> problem.isSearchComplete()
+    False
     """
 
     def __init__(self, steps=1000):
@@ -679,12 +1183,16 @@ class MinConflictsSolver(Solver):
         """
         self._steps = steps
 
-    def getSolution(self, domains, constraints, vconstraints):
+    def getSolution(self, domains, constraints, vconstraints, limit=None):
         assignments = {}
         # Initial assignment
         for variable in domains:
             assignments[variable] = random.choice(domains[variable])
         for _ in xrange(self._steps):
+            # Every step is a search node; give up once the search is
+            # out of time or nodes.
+            if limit is not None and not limit.visitNode():
+                return None
             conflicted = False
             lst = list(domains.keys())
             random.shuffle(lst)